@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session as SQLAlchemySession
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from app.config import get_config
+from app.json_provider import OrjsonProvider
 from app.models import Base
 
 engine: Any = None
@@ -23,6 +24,7 @@ def create_app(config_class: type | None = None) -> APIFlask:
         version="0.1.0",
         docs_ui="redoc",
     )
+    app.json = OrjsonProvider(app)
     app.config["DESCRIPTION"] = "Personal finance tracker API"
     app.config["SERVERS"] = [
         {"name": "Local", "url": "http://localhost:5000"},
@@ -38,7 +40,10 @@ def create_app(config_class: type | None = None) -> APIFlask:
     cors_origins = [o.strip() for o in cors_config.split(",") if o.strip()]
     CORS(app, origins=cors_origins or ["http://localhost:3000"])
 
-    engine = create_engine(app.config["SQLALCHEMY_DATABASE_URI"])
+    engine = create_engine(
+        app.config["SQLALCHEMY_DATABASE_URI"],
+        **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+    )
     session_factory = sessionmaker(bind=engine)
     Session = scoped_session(session_factory)
 
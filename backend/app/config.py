@@ -1,6 +1,8 @@
 import os
+from typing import Any
 
 from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
 
 load_dotenv()
 
@@ -10,6 +12,8 @@ class Config:
 
     SECRET_KEY = os.environ.get("SECRET_KEY", "dev-secret-key")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Extra keyword arguments for create_engine()
+    SQLALCHEMY_ENGINE_OPTIONS: dict[str, Any] = {}
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "http://localhost:3000")
 
     @staticmethod
@@ -32,6 +36,11 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # Share the single in-memory database across all sessions and threads
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
 
 
 def _require_env(name: str) -> str:
@@ -13,7 +13,6 @@ helper functions for various financial calculations.
 
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
 from typing import Literal
 
 from app.models import NetWorthSnapshot
@@ -67,20 +66,11 @@ def calculate_monthly_change_rate(
         return 0.0, 0
 
     num_months = PERIOD_MONTHS.get(period, 3)
+    changes_count = min(num_months, len(snapshots) - 1)
 
-    # Calculate changes over the specified period
-    total_change = Decimal("0")
-    changes_count = 0
-
-    for i in range(min(num_months, len(snapshots) - 1)):
-        current = snapshots[i]
-        previous = snapshots[i + 1]
-        change = current.net_worth - previous.net_worth
-        total_change += change
-        changes_count += 1
-
-    if changes_count == 0:
-        return 0.0, 0
+    # The month-to-month changes telescope, so their sum is simply the
+    # difference between the newest snapshot and the oldest one in the period
+    total_change = snapshots[0].net_worth - snapshots[changes_count].net_worth
 
     avg_monthly_change = float(total_change / changes_count)
     return avg_monthly_change, changes_count
@@ -111,17 +101,12 @@ def generate_net_worth_forecast(
     if snapshots:
         latest = snapshots[0]
         current_nw = float(latest.net_worth)
-        current_month = latest.month
-        current_year = latest.year
+        # Months since year 0, so each projected month is a single divmod
+        base_index = latest.year * 12 + latest.month - 1
 
         for i in range(1, months_ahead + 1):
-            # Calculate next month
-            next_month = current_month + i
-            next_year = current_year
-
-            while next_month > 12:
-                next_month -= 12
-                next_year += 1
+            next_year, month_index = divmod(base_index + i, 12)
+            next_month = month_index + 1
 
             projected_nw = current_nw + (monthly_rate * i)
 
@@ -243,13 +228,10 @@ def calculate_trajectory_comparison(
     current_trajectory = []
     required_trajectory = []
 
+    base_index = current_dt.year * 12 + current_dt.month - 1
     for i in range(months_remaining + 1):
-        month = current_dt.month + i
-        year = current_dt.year
-
-        while month > 12:
-            month -= 12
-            year += 1
+        year, month_index = divmod(base_index + i, 12)
+        month = month_index + 1
 
         label = f"{year}-{month:02d}"
         current_trajectory.append(
@@ -0,0 +1,70 @@
+"""JSON provider backed by orjson.
+
+Serializes responses and parses request bodies with orjson. Keys are sorted
+when sort_keys is set, as it is by default, and values orjson does not handle
+itself (Decimal, datetime) go through Flask's defaults. Output differs from
+Flask's default provider in a few ways:
+- ensure_ascii is False, so non-ASCII text is sent as UTF-8, not escaped
+- output without indentation has no spaces after separators
+- float NaN and Infinity are written as null rather than invalid JSON
+- NaN and Infinity in request bodies are rejected as invalid JSON
+
+Arguments orjson cannot express, such as ensure_ascii=True or an indent other
+than 2, and values it cannot encode, such as integers beyond 64 bits, fall
+back to Flask's json-based implementation.
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Datetimes are passed through so Flask keeps formatting them as HTTP dates
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+COMPACT_SEPARATORS = (",", ":")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider using orjson for encoding and decoding."""
+
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string."""
+        kwargs.setdefault("default", self.default)
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        kwargs.setdefault("sort_keys", self.sort_keys)
+        indent = kwargs.get("indent")
+        unsupported = set(kwargs) - {
+            "default",
+            "ensure_ascii",
+            "sort_keys",
+            "indent",
+            "separators",
+        }
+        if (
+            kwargs["ensure_ascii"]
+            or indent not in (None, 2)
+            or kwargs.get("separators", COMPACT_SEPARATORS) != COMPACT_SEPARATORS
+            or unsupported
+        ):
+            return super().dumps(obj, **kwargs)
+
+        option = ORJSON_OPTIONS
+        if kwargs["sort_keys"]:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=kwargs["default"], option=option).decode()
+        except orjson.JSONEncodeError:
+            # Re-encode with json, which handles big integers and raises
+            # Flask's own TypeError for values that cannot be serialized
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize data as JSON."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from apiflask import APIBlueprint
 from flask import Response, jsonify, request
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app import get_session
 from app.models import (
@@ -11,6 +11,7 @@ from app.models import (
     Goal,
     IncomeItem,
     NetWorthCategory,
+    NetWorthEntry,
     NetWorthSnapshot,
 )
 
@@ -229,6 +230,8 @@ def delete_goal(goal_id: int) -> tuple[Response, int]:
 
 def _get_snapshots(session: Session, num_months: int) -> list[NetWorthSnapshot]:
     """Get snapshots ordered newest first."""
+    # ix_networth_year_month is scanned backwards for this order, so the
+    # newest rows are read straight from the index without a sort
     result: list[NetWorthSnapshot] = (
         session.query(NetWorthSnapshot)
         .order_by(NetWorthSnapshot.year.desc(), NetWorthSnapshot.month.desc())
@@ -238,14 +241,25 @@ def _get_snapshots(session: Session, num_months: int) -> list[NetWorthSnapshot]:
     return result
 
 
-def _get_category_amount_in_snapshot(
-    snapshot: NetWorthSnapshot, category_id: int
-) -> Decimal:
-    """Get the amount for a specific category in a snapshot."""
-    for entry in snapshot.entries:
-        if entry.category_id == category_id:
-            return entry.amount if entry.amount is not None else Decimal("0")
-    return Decimal("0")
+def _get_category_amounts(
+    session: Session, snapshot: NetWorthSnapshot, category_ids: set[int]
+) -> dict[int, Decimal]:
+    """Get entry amounts for the given categories in a snapshot in one query."""
+    if not category_ids:
+        return {}
+
+    rows = (
+        session.query(NetWorthEntry.category_id, NetWorthEntry.amount)
+        .filter(
+            NetWorthEntry.snapshot_id == snapshot.id,
+            NetWorthEntry.category_id.in_(category_ids),
+        )
+        .all()
+    )
+    return {
+        category_id: amount if amount is not None else Decimal("0")
+        for category_id, amount in rows
+    }
 
 
 def _calculate_net_income(
@@ -311,9 +325,12 @@ def calculate_goal_progress(
     goal: Goal,
     snapshots: list[NetWorthSnapshot],
     net_income: Decimal,
+    category_amounts: dict[int, Decimal],
 ) -> dict:
     """Calculate progress for a single goal.
 
+    category_amounts maps category_id to its amount in the latest snapshot.
+
     Returns a dict with:
     - goal: the goal data
     - current_value: current progress value
@@ -376,7 +393,7 @@ def calculate_goal_progress(
     elif goal.goal_type in ("savings_goal", "category_target"):
         # Target balance for a specific category
         if latest and goal.category_id:
-            current_value = _get_category_amount_in_snapshot(latest, goal.category_id)
+            current_value = category_amounts.get(goal.category_id, zero)
             # Use absolute value for display
             current_value = abs(current_value)
             category_name = goal.category.name if goal.category else None
@@ -427,9 +444,10 @@ def get_goals_progress() -> Response:
     """
     session = get_session()
 
-    # Get all active goals
+    # Get all active goals, loading their categories for to_dict() up front
     goals = (
         session.query(Goal)
+        .options(selectinload(Goal.category).selectinload(NetWorthCategory.group))
         .filter_by(is_active=True)
         .order_by(Goal.created_at.desc())
         .all()
@@ -447,9 +465,16 @@ def get_goals_progress() -> Response:
     income_items = session.query(IncomeItem).all()
     net_income = _calculate_net_income(income_items, tax_pct)
 
+    # Category balances in the latest snapshot, fetched for all goals at once
+    category_ids = {goal.category_id for goal in goals if goal.category_id}
+    category_amounts = (
+        _get_category_amounts(session, snapshots[0], category_ids) if snapshots else {}
+    )
+
     # Calculate progress for each goal
     progress_list = [
-        calculate_goal_progress(goal, snapshots, net_income) for goal in goals
+        calculate_goal_progress(goal, snapshots, net_income, category_amounts)
+        for goal in goals
     ]
 
     return jsonify(progress_list)
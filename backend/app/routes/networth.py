@@ -1,12 +1,14 @@
+from collections.abc import Mapping
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
 from apiflask import APIBlueprint
 from flask import Response, jsonify, request
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
 from app import get_session
-from app.forecasting import generate_net_worth_forecast
+from app.forecasting import PERIOD_MONTHS, generate_net_worth_forecast
 from app.models import NetWorthCategory, NetWorthEntry, NetWorthGroup, NetWorthSnapshot
 
 bp = APIBlueprint("networth", __name__, tag="Net Worth")
@@ -17,6 +19,37 @@ MAX_AMOUNT_VALUE = 1_000_000_000  # 1 billion
 # Valid group types
 VALID_GROUP_TYPES = {"asset", "liability"}
 
+# Default groups with colors (name, group_type, color, display_order)
+DEFAULT_GROUPS = [
+    ("Cash", "asset", "#22c55e", 1),  # green
+    ("Investments", "asset", "#3b82f6", 2),  # blue
+    ("Crypto", "asset", "#f59e0b", 3),  # amber
+    ("Property", "asset", "#8b5cf6", 4),  # purple
+    ("Loans", "liability", "#ef4444", 10),  # red
+    ("Credit Card", "liability", "#f97316", 11),  # orange
+]
+
+# Default categories (name, group_name, is_personal, display_order)
+DEFAULT_CATEGORIES = [
+    # Cash group
+    ("Checking", "Cash", True, 1),
+    ("Savings", "Cash", True, 2),
+    ("Rent Account", "Cash", True, 3),
+    ("Company Checkings", "Cash", False, 4),
+    # Investments group
+    ("Personal Investments", "Investments", True, 10),
+    ("Personal Bonds", "Investments", True, 11),
+    ("Company Investments", "Investments", False, 12),
+    # Crypto group
+    ("Crypto", "Crypto", True, 20),
+    # Property group
+    ("House/Apartment", "Property", True, 30),
+    # Loans group
+    ("Student Loan", "Loans", True, 50),
+    # Credit Card group
+    ("Credit Card", "Credit Card", True, 60),
+]
+
 
 # =============================================================================
 # Group Endpoints
@@ -313,6 +346,33 @@ def delete_category(category_id: int) -> Response | tuple[Response, int]:
     return jsonify({"message": "Category deleted"})
 
 
+def add_default_categories(session: Session) -> None:
+    """Add the default groups and categories to the session without committing.
+
+    Categories reference their groups through the relationship, so everything
+    is inserted in a single flush, in list order.
+    """
+    group_by_name: dict[str, NetWorthGroup] = {}
+    for name, group_type, color, order in DEFAULT_GROUPS:
+        group_by_name[name] = NetWorthGroup(
+            name=name,
+            group_type=group_type,
+            color=color,
+            display_order=order,
+        )
+    session.add_all(group_by_name.values())
+
+    session.add_all(
+        NetWorthCategory(
+            name=name,
+            group=group_by_name[group_name],
+            is_personal=is_personal,
+            display_order=order,
+        )
+        for name, group_name, is_personal, order in DEFAULT_CATEGORIES
+    )
+
+
 @bp.post("/api/networth/categories/seed")
 def seed_categories() -> Response | tuple[Response, int]:
     """Seed default net worth groups and categories."""
@@ -329,69 +389,16 @@ def seed_categories() -> Response | tuple[Response, int]:
             409,
         )
 
-    # Default groups with colors
-    default_groups = [
-        # (name, group_type, color, display_order)
-        ("Cash", "asset", "#22c55e", 1),  # green
-        ("Investments", "asset", "#3b82f6", 2),  # blue
-        ("Crypto", "asset", "#f59e0b", 3),  # amber
-        ("Property", "asset", "#8b5cf6", 4),  # purple
-        ("Loans", "liability", "#ef4444", 10),  # red
-        ("Credit Card", "liability", "#f97316", 11),  # orange
-    ]
-
-    group_by_name: dict[str, NetWorthGroup] = {}
-    for name, group_type, color, order in default_groups:
-        group = NetWorthGroup(
-            name=name,
-            group_type=group_type,
-            color=color,
-            display_order=order,
-        )
-        session.add(group)
-        session.flush()  # Get the ID
-        group_by_name[name] = group
-
-    # Default categories (name, group_name, is_personal, display_order)
-    default_categories = [
-        # Cash group
-        ("Checking", "Cash", True, 1),
-        ("Savings", "Cash", True, 2),
-        ("Rent Account", "Cash", True, 3),
-        ("Company Checkings", "Cash", False, 4),
-        # Investments group
-        ("Personal Investments", "Investments", True, 10),
-        ("Personal Bonds", "Investments", True, 11),
-        ("Company Investments", "Investments", False, 12),
-        # Crypto group
-        ("Crypto", "Crypto", True, 20),
-        # Property group
-        ("House/Apartment", "Property", True, 30),
-        # Loans group
-        ("Student Loan", "Loans", True, 50),
-        # Credit Card group
-        ("Credit Card", "Credit Card", True, 60),
-    ]
-
-    for name, group_name, is_personal, order in default_categories:
-        category = NetWorthCategory(
-            name=name,
-            group_id=group_by_name[group_name].id,
-            is_personal=is_personal,
-            display_order=order,
-        )
-        session.add(category)
-
+    add_default_categories(session)
     session.commit()
 
-    categories = session.query(NetWorthCategory).all()
-    groups = session.query(NetWorthGroup).all()
+    # The tables were empty, so the defaults are exactly what was inserted
     return (
         jsonify(
             {
                 "message": "Seeded default groups and categories",
-                "groups": len(groups),
-                "categories": len(categories),
+                "groups": len(DEFAULT_GROUPS),
+                "categories": len(DEFAULT_CATEGORIES),
             }
         ),
         201,
@@ -420,14 +427,14 @@ def _get_previous_net_worth(session: Session, year: int, month: int) -> Decimal
     return previous.net_worth if previous else None
 
 
-def _recalculate_next_month(session: Session, year: int, month: int) -> None:
+def _recalculate_next_month(session: Session, snapshot: NetWorthSnapshot) -> None:
     """Recalculate the next month's change_from_previous if it exists."""
-    if month == 12:
-        next_year = year + 1
+    if snapshot.month == 12:
+        next_year = snapshot.year + 1
         next_month = 1
     else:
-        next_year = year
-        next_month = month + 1
+        next_year = snapshot.year
+        next_month = snapshot.month + 1
 
     next_snapshot = (
         session.query(NetWorthSnapshot)
@@ -436,12 +443,8 @@ def _recalculate_next_month(session: Session, year: int, month: int) -> None:
     )
 
     if next_snapshot:
-        # Get the current month's net worth (which was just updated)
-        current = (
-            session.query(NetWorthSnapshot).filter_by(year=year, month=month).first()
-        )
-        previous_net_worth = current.net_worth if current else None
-        next_snapshot.calculate_totals(previous_net_worth)
+        # The caller has just updated snapshot, so use it instead of reloading
+        next_snapshot.calculate_totals(snapshot.net_worth)
 
 
 def _validate_snapshot_data(data: dict) -> tuple[bool, str | None]:
@@ -466,24 +469,63 @@ def _validate_snapshot_data(data: dict) -> tuple[bool, str | None]:
         return False, "year must be an integer"
 
     # Validate entries if provided
-    entries = data.get("entries", [])
+    error = _validate_entries(data.get("entries", []))
+    if error:
+        return False, error
+
+    return True, None
+
+
+def _validate_entries(entries: object) -> str | None:
+    """Validate a list of {category_id, amount} entries. Returns an error or None.
+
+    Shared by snapshot create and update so both apply the same rules.
+    """
     if not isinstance(entries, list):
-        return False, "entries must be a list"
+        return "entries must be a list"
 
     for i, entry in enumerate(entries):
         if not isinstance(entry, dict):
-            return False, f"entries[{i}] must be an object"
+            return f"entries[{i}] must be an object"
         if "category_id" not in entry:
-            return False, f"entries[{i}].category_id is required"
+            return f"entries[{i}].category_id is required"
         if "amount" in entry:
+            amount = entry["amount"]
+            # Whole amounts are the common case and compare without parsing;
+            # bool is excluded because Decimal rejects it
+            if type(amount) is int:
+                if abs(amount) > MAX_AMOUNT_VALUE:
+                    return f"entries[{i}].amount exceeds maximum allowed value"
+                continue
             try:
-                value = Decimal(str(entry["amount"]))
+                value = Decimal(str(amount))
                 if abs(value) > MAX_AMOUNT_VALUE:
-                    return False, f"entries[{i}].amount exceeds maximum allowed value"
+                    return f"entries[{i}].amount exceeds maximum allowed value"
             except (ValueError, TypeError, InvalidOperation):
-                return False, f"entries[{i}].amount must be a number"
+                return f"entries[{i}].amount must be a number"
 
-    return True, None
+    return None
+
+
+def _find_missing_category(session: Session, entries: list[dict]) -> int | None:
+    """Return the first category_id in entries that does not exist, if any.
+
+    All categories are checked with a single query instead of one per entry.
+    """
+    category_ids = [int(entry["category_id"]) for entry in entries]
+    if not category_ids:
+        return None
+
+    existing = {
+        category_id
+        for (category_id,) in session.query(NetWorthCategory.id).filter(
+            NetWorthCategory.id.in_(category_ids)
+        )
+    }
+    for category_id in category_ids:
+        if category_id not in existing:
+            return category_id
+    return None
 
 
 @bp.get("/api/networth")
@@ -533,30 +575,29 @@ def create_snapshot() -> Response | tuple[Response, int]:
     month = int(data["month"])
     year = int(data["year"])
 
-    # Check for duplicate
-    existing = session.query(NetWorthSnapshot).filter_by(year=year, month=month).first()
-    if existing:
+    # Create snapshot; uq_networth_year_month rejects duplicates, which are
+    # reported before any problem with the entries
+    snapshot = NetWorthSnapshot(month=month, year=year)
+    session.add(snapshot)
+    try:
+        session.flush()  # Get the snapshot ID
+    except IntegrityError:
+        session.rollback()
         return (
             jsonify({"error": f"Snapshot for {year}-{month:02d} already exists"}),
             409,
         )
 
-    # Create snapshot
-    snapshot = NetWorthSnapshot(month=month, year=year)
-    session.add(snapshot)
-    session.flush()  # Get the snapshot ID
+    # Validate categories exist
+    entries_data = data.get("entries", [])
+    missing_id = _find_missing_category(session, entries_data)
+    if missing_id is not None:
+        session.rollback()
+        return jsonify({"error": f"Category {missing_id} not found"}), 400
 
     # Create entries
-    entries_data = data.get("entries", [])
     for entry_data in entries_data:
         category_id = int(entry_data["category_id"])
-
-        # Validate category exists
-        category = session.query(NetWorthCategory).filter_by(id=category_id).first()
-        if not category:
-            session.rollback()
-            return jsonify({"error": f"Category {category_id} not found"}), 400
-
         amount = Decimal(str(entry_data.get("amount", 0)))
         entry = NetWorthEntry(
             snapshot_id=snapshot.id,
@@ -627,44 +668,25 @@ def update_snapshot(snapshot_id: int) -> Response | tuple[Response, int]:
     # Update entries if provided
     if "entries" in data:
         entries_data = data["entries"]
-        if not isinstance(entries_data, list):
-            return jsonify({"error": "entries must be a list"}), 400
-
-        # Validate entries
-        for i, entry_data in enumerate(entries_data):
-            if not isinstance(entry_data, dict):
-                return jsonify({"error": f"entries[{i}] must be an object"}), 400
-            if "category_id" not in entry_data:
-                return jsonify({"error": f"entries[{i}].category_id is required"}), 400
-            if "amount" in entry_data:
-                try:
-                    value = Decimal(str(entry_data["amount"]))
-                    if abs(value) > MAX_AMOUNT_VALUE:
-                        msg = f"entries[{i}].amount exceeds maximum allowed value"
-                        return jsonify({"error": msg}), 400
-                except (ValueError, TypeError, InvalidOperation):
-                    return (
-                        jsonify({"error": f"entries[{i}].amount must be a number"}),
-                        400,
-                    )
+        error = _validate_entries(entries_data)
+        if error:
+            return jsonify({"error": error}), 400
+
+        # Validate categories exist
+        missing_id = _find_missing_category(session, entries_data)
+        if missing_id is not None:
+            session.rollback()
+            return jsonify({"error": f"Category {missing_id} not found"}), 400
 
         # Delete existing entries
         session.query(NetWorthEntry).filter_by(snapshot_id=snapshot_id).delete()
 
         # Create new entries
         for entry_data in entries_data:
-            category_id = int(entry_data["category_id"])
-
-            # Validate category exists
-            category = session.query(NetWorthCategory).filter_by(id=category_id).first()
-            if not category:
-                session.rollback()
-                return jsonify({"error": f"Category {category_id} not found"}), 400
-
             amount = Decimal(str(entry_data.get("amount", 0)))
             entry = NetWorthEntry(
                 snapshot_id=snapshot.id,
-                category_id=category_id,
+                category_id=int(entry_data["category_id"]),
                 amount=amount,
             )
             session.add(entry)
@@ -678,7 +700,7 @@ def update_snapshot(snapshot_id: int) -> Response | tuple[Response, int]:
     snapshot.calculate_totals(previous_net_worth)
 
     # Recalculate next month's change_from_previous if it exists
-    _recalculate_next_month(session, snapshot.year, snapshot.month)
+    _recalculate_next_month(session, snapshot)
 
     session.commit()
     return jsonify(snapshot.to_dict())
@@ -736,8 +758,12 @@ def seed_networth() -> Response | tuple[Response, int]:
             409,
         )
 
-    # Get categories (required)
-    categories = session.query(NetWorthCategory).all()
+    # Get categories (required), with groups for calculating totals in memory
+    categories = (
+        session.query(NetWorthCategory)
+        .options(selectinload(NetWorthCategory.group))
+        .all()
+    )
     if not categories:
         return (
             jsonify({"error": "No categories found. Seed categories first."}),
@@ -955,34 +981,27 @@ def seed_networth() -> Response | tuple[Response, int]:
         ),
     ]
 
+    # Entries reference loaded categories, so totals are calculated in memory
+    # without flushing and reloading each snapshot
     previous_net_worth = None
+    snapshots = []
     for month, amounts in base_data:
-        snapshot = NetWorthSnapshot(month=month, year=seed_year)
-        session.add(snapshot)
-        session.flush()
-
-        # Create entries for this snapshot
-        for cat_name, amount in amounts.items():
-            category = cat_by_name[cat_name]
-            entry = NetWorthEntry(
-                snapshot_id=snapshot.id,
-                category_id=category.id,
-                amount=Decimal(str(amount)),
-            )
-            session.add(entry)
-
-        session.flush()
-        session.refresh(snapshot)
+        snapshot = NetWorthSnapshot(
+            month=month,
+            year=seed_year,
+            entries=[
+                NetWorthEntry(category=cat_by_name[name], amount=Decimal(str(amount)))
+                for name, amount in amounts.items()
+            ],
+        )
         snapshot.calculate_totals(previous_net_worth)
         previous_net_worth = snapshot.net_worth
+        snapshots.append(snapshot)
 
+    # Insert everything in one flush and commit
+    session.add_all(snapshots)
     session.commit()
 
-    snapshots = (
-        session.query(NetWorthSnapshot)
-        .order_by(NetWorthSnapshot.year, NetWorthSnapshot.month)
-        .all()
-    )
     return (
         jsonify(
             {"message": "Seeded 12 months of net worth data", "count": len(snapshots)}
@@ -999,6 +1018,25 @@ def seed_networth() -> Response | tuple[Response, int]:
 VALID_FORECAST_PERIODS = {"month", "quarter", "half_year", "year"}
 
 
+def _parse_forecast_params(args: Mapping[str, str]) -> tuple[str, int]:
+    """Parse forecast query parameters into (period, months_ahead).
+
+    Raises ValueError with a client-facing message when a parameter is invalid.
+    """
+    period = args.get("period", "quarter")
+    if period not in VALID_FORECAST_PERIODS:
+        raise ValueError(f"period must be one of: {VALID_FORECAST_PERIODS}")
+
+    try:
+        months_ahead = int(args.get("months_ahead", 12))
+    except (ValueError, TypeError):
+        raise ValueError("months_ahead must be an integer") from None
+    if months_ahead < 1 or months_ahead > 36:
+        raise ValueError("months_ahead must be between 1 and 36")
+
+    return period, months_ahead
+
+
 @bp.get("/api/networth/forecast")
 def get_forecast() -> Response | tuple[Response, int]:
     """Get net worth forecast based on historical trend.
@@ -1010,27 +1048,19 @@ def get_forecast() -> Response | tuple[Response, int]:
 
     Returns projected net worth values and the monthly change rate used.
     """
-    session = get_session()
-
-    # Parse and validate query parameters
-    period = request.args.get("period", "quarter")
-    if period not in VALID_FORECAST_PERIODS:
-        return (
-            jsonify({"error": f"period must be one of: {VALID_FORECAST_PERIODS}"}),
-            400,
-        )
-
     try:
-        months_ahead = int(request.args.get("months_ahead", 12))
-        if months_ahead < 1 or months_ahead > 36:
-            return jsonify({"error": "months_ahead must be between 1 and 36"}), 400
-    except (ValueError, TypeError):
-        return jsonify({"error": "months_ahead must be an integer"}), 400
+        period, months_ahead = _parse_forecast_params(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    session = get_session()
 
-    # Get snapshots ordered newest first
+    # The forecast only looks at the newest snapshot and the changes within the
+    # period, so fetch just those rows (newest first) via ix_networth_year_month
     snapshots = (
         session.query(NetWorthSnapshot)
         .order_by(NetWorthSnapshot.year.desc(), NetWorthSnapshot.month.desc())
+        .limit(PERIOD_MONTHS[period] + 1)
         .all()
     )
 
@@ -1,20 +1,186 @@
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import cache
+
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
 
-from app import create_app
+import app as app_module
+from app import create_app, get_session
 from app.config import TestingConfig
+from app.models import NetWorthEntry, NetWorthSnapshot
+from app.routes.networth import add_default_categories
 
 
-@pytest.fixture
+def _insert_snapshots(app, rows):
+    """Write snapshots for (month, year, category_id, amount) rows in one commit.
+
+    Rows sharing a month become entries of one snapshot. Snapshots are inserted
+    in the order their months first appear, so ids need not follow dates.
+    Totals are calculated oldest first, with change_from_previous taken from
+    the preceding calendar month when it is part of the same batch.
+    """
+    by_month = {}
+    for month, year, category_id, amount in rows:
+        by_month.setdefault((year, month), []).append((category_id, amount))
+
+    with app.app_context():
+        session = get_session()
+        snapshots = {
+            key: NetWorthSnapshot(
+                year=key[0],
+                month=key[1],
+                entries=[
+                    NetWorthEntry(category_id=category_id, amount=Decimal(str(amount)))
+                    for category_id, amount in entries
+                ],
+            )
+            for key, entries in by_month.items()
+        }
+        session.add_all(snapshots.values())
+        session.flush()
+
+        for (year, month), snapshot in sorted(snapshots.items()):
+            previous_key = (year - 1, 12) if month == 1 else (year, month - 1)
+            previous = snapshots.get(previous_key)
+            snapshot.calculate_totals(previous.net_worth if previous else None)
+        session.commit()
+
+
+@contextmanager
+def _savepoint(connection):
+    """Bind the app's Session to connection inside a SAVEPOINT, then roll it back.
+
+    Sessions join with create_savepoint, so commit() and rollback() in the
+    routes only release or roll back their own nested SAVEPOINT.
+    """
+    savepoint = connection.begin_nested()
+    session_factory = sessionmaker(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(app_module, "Session", scoped_session(session_factory))
+        try:
+            yield
+        finally:
+            app_module.Session.remove()
+            savepoint.rollback()
+
+
+@pytest.fixture(scope="session")
 def app():
-    """Create application for testing."""
-    app = create_app(TestingConfig)
-    yield app
+    """Create the application once, on an in-memory SQLite database.
+
+    Under pytest-xdist each worker is a separate process with its own database.
+    """
+    return create_app(TestingConfig)
+
+
+@pytest.fixture(scope="session")
+def db_connection(app):
+    """Open one connection with an outer transaction that is never committed.
+
+    pysqlite's own transaction handling breaks SAVEPOINT, so it is turned off
+    and BEGIN is emitted explicitly, following the SQLAlchemy docs recipe.
+    """
+    connection = app_module.engine.connect()
+    connection.connection.driver_connection.isolation_level = None
+    event.listen(connection, "begin", lambda conn: conn.exec_driver_sql("BEGIN"))
+
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_transaction(db_connection):
+    """Run the test in a SAVEPOINT that is rolled back afterwards."""
+    with _savepoint(db_connection):
+        yield
+
+
+@pytest.fixture(scope="module")
+def default_categories(app, db_connection):
+    """Seed the default groups and categories for the requesting module.
+
+    The rows live in a module-wide SAVEPOINT that each test's own SAVEPOINT
+    nests inside, so they are removed again when the module finishes.
+    """
+    with _savepoint(db_connection), app.app_context():
+        add_default_categories(get_session())
+        get_session().commit()
+        yield
+
+
+@pytest.fixture
+def client(app, db_transaction):
+    """Create test client, keeping one app context pushed for the test."""
+    with app.app_context(), app.test_client() as client:
+        yield client
+
+
+@pytest.fixture(scope="class")
+def class_client(app, db_connection):
+    """Create a test client for data shared by every test in a class.
+
+    Rows created through it live in a class-wide SAVEPOINT that each test's
+    own SAVEPOINT nests inside, so setup runs once per class and tests still
+    cannot see each other's changes. Once created, the shared rows are visible
+    to every later test in the class, including tests that did not request
+    them, so tests that need an empty table belong in a class of their own.
+    """
+    with _savepoint(db_connection), app.app_context(), app.test_client() as client:
+        yield client
 
 
 @pytest.fixture
-def client(app):
-    """Create test client."""
-    return app.test_client()
+def bulk_snapshots(app, db_transaction):
+    """Return a helper that writes snapshot rows directly in one transaction.
+
+    Rows are (month, year, category_id, amount) tuples; the categories must
+    already exist.
+    """
+    return lambda rows: _insert_snapshots(app, rows)
+
+
+@pytest.fixture(scope="class")
+def class_bulk_snapshots(app, class_client):
+    """Return a bulk_snapshots helper whose rows are shared by a whole class.
+
+    Rows are written in the class-wide SAVEPOINT, so class-scoped fixtures can
+    build snapshot series once per class.
+    """
+    return lambda rows: _insert_snapshots(app, rows)
+
+
+@pytest.fixture
+def snapshot_factory(app, db_transaction):
+    """Return a helper that creates one snapshot directly and returns its id.
+
+    entries is a sequence of (category_id, amount) pairs. Totals are
+    calculated as for a first month, so change_from_previous is zero.
+    """
+
+    def _make(month=1, year=2024, entries=()):
+        with app.app_context():
+            session = get_session()
+            snapshot = NetWorthSnapshot(
+                month=month,
+                year=year,
+                entries=[
+                    NetWorthEntry(category_id=category_id, amount=Decimal(str(amount)))
+                    for category_id, amount in entries
+                ],
+            )
+            session.add(snapshot)
+            session.flush()
+            snapshot.calculate_totals(None)
+            session.commit()
+            return snapshot.id
+
+    return _make
 
 
 @pytest.fixture
@@ -22,3 +188,62 @@ def seeded_client(client):
     """Create test client with seeded data."""
     client.post("/api/seed")
     return client
+
+
+@pytest.fixture(scope="module")
+def progress_for(app, db_connection, default_categories):
+    """Return a cached helper that builds a setup and returns goal progress."""
+
+    @cache
+    def _progress_for(setup_key):
+        """Build the state described by setup_key and return goal progress.
+
+        setup_key is a tuple of steps, applied in order on top of the default
+        net worth categories and rolled back afterwards:
+        - ("snap", month, year, category_id, amount): entry in a snapshot, in
+          the row order _insert_snapshots takes
+        - ("income", gross_amount): taxed income item
+        - ("goal", goal_type, target_value[, extra]): goal, where extra is a
+          tuple of (field, value) pairs such as (("category_id", 1),)
+
+        Every setup request must succeed, so a rejected step fails the test
+        instead of silently leaving the setup incomplete. Responses are cached
+        per setup_key, so callers must not mutate them.
+        """
+        with _savepoint(db_connection), app.app_context():
+            client = app.test_client()
+
+            _insert_snapshots(
+                app, [step[1:] for step in setup_key if step[0] == "snap"]
+            )
+
+            for step in setup_key:
+                if step[0] == "income":
+                    response = client.post(
+                        "/api/income",
+                        json={
+                            "name": "Salary",
+                            "gross_amount": step[1],
+                            "is_taxed": True,
+                        },
+                    )
+                    assert response.status_code == 201
+                elif step[0] == "goal":
+                    goal_type, target_value = step[1], step[2]
+                    extra = dict(step[3]) if len(step) > 3 else {}
+                    response = client.post(
+                        "/api/goals",
+                        json={
+                            "name": f"{goal_type} {target_value}",
+                            "goal_type": goal_type,
+                            "target_value": target_value,
+                            **extra,
+                        },
+                    )
+                    assert response.status_code == 201
+
+            response = client.get("/api/goals/progress")
+            assert response.status_code == 200
+            return response.json
+
+    return _progress_for
@@ -135,8 +135,9 @@ class TestAccounts:
             json={"name": "Updated", "balance": 200.00},
         )
         assert response.status_code == 200
-        assert response.json["name"] == "Updated"
-        assert response.json["balance"] == 200.00
+        data = response.json
+        assert data["name"] == "Updated"
+        assert data["balance"] == 200.00
 
     def test_delete_account(self, client):
         """DELETE /api/accounts/<id> removes account."""
@@ -211,8 +212,9 @@ class TestIncome:
             json={"name": "Updated", "gross_amount": 200.00},
         )
         assert response.status_code == 200
-        assert response.json["name"] == "Updated"
-        assert response.json["gross_amount"] == 200.00
+        data = response.json
+        assert data["name"] == "Updated"
+        assert data["gross_amount"] == 200.00
 
     def test_delete_income(self, client):
         """DELETE /api/income/<id> removes income item."""
@@ -260,8 +262,9 @@ class TestExpenses:
             json={"name": "Updated", "amount": 200.00},
         )
         assert response.status_code == 200
-        assert response.json["name"] == "Updated"
-        assert response.json["amount"] == 200.00
+        data = response.json
+        assert data["name"] == "Updated"
+        assert data["amount"] == 200.00
 
     def test_delete_expense(self, client):
         """DELETE /api/expenses/<id> removes expense item."""
@@ -516,9 +519,10 @@ class TestEdgeCases:
         # Update only balance
         response = client.put(f"/api/accounts/{account_id}", json={"balance": 2000})
         assert response.status_code == 200
-        assert response.json["balance"] == 2000.0
-        assert response.json["name"] == "Test"  # Preserved
-        assert response.json["is_credit"] is True  # Preserved
+        data = response.json
+        assert data["balance"] == 2000.0
+        assert data["name"] == "Test"  # Preserved
+        assert data["is_credit"] is True  # Preserved
 
     def test_partial_update_income(self, client):
         """PUT /api/income/<id> with partial data preserves other fields."""
@@ -530,9 +534,10 @@ class TestEdgeCases:
 
         response = client.put(f"/api/income/{income_id}", json={"gross_amount": 6000})
         assert response.status_code == 200
-        assert response.json["gross_amount"] == 6000.0
-        assert response.json["name"] == "Salary"
-        assert response.json["is_taxed"] is True
+        data = response.json
+        assert data["gross_amount"] == 6000.0
+        assert data["name"] == "Salary"
+        assert data["is_taxed"] is True
 
     def test_partial_update_expense(self, client):
         """PUT /api/expenses/<id> with partial data preserves other fields."""
@@ -544,8 +549,9 @@ class TestEdgeCases:
 
         response = client.put(f"/api/expenses/{expense_id}", json={"amount": 1300})
         assert response.status_code == 200
-        assert response.json["amount"] == 1300.0
-        assert response.json["name"] == "Rent"
+        data = response.json
+        assert data["amount"] == 1300.0
+        assert data["name"] == "Rent"
 
     def test_tax_percentage_boundary_values(self, client):
         """Tax percentage accepts boundary values 0 and 100."""
@@ -566,8 +572,9 @@ class TestEdgeCases:
         )
 
         response = client.get("/api/budget/current")
-        assert response.json["totals"]["gross_income"] == 5000.0
-        assert response.json["totals"]["net_income"] == 5000.0
+        data = response.json
+        assert data["totals"]["gross_income"] == 5000.0
+        assert data["totals"]["net_income"] == 5000.0
 
     def test_net_income_100_percent_tax(self, client):
         """Net income is 0 when tax is 100%."""
@@ -578,8 +585,9 @@ class TestEdgeCases:
         )
 
         response = client.get("/api/budget/current")
-        assert response.json["totals"]["gross_income"] == 5000.0
-        assert response.json["totals"]["net_income"] == 0.0
+        data = response.json
+        assert data["totals"]["gross_income"] == 5000.0
+        assert data["totals"]["net_income"] == 0.0
 
     def test_income_not_found(self, client):
         """PUT/DELETE return 404 for non-existent income."""
@@ -1,5 +1,16 @@
 """Tests for goals API endpoints."""
 
+import json
+
+import pytest
+
+# Payload shared by the CRUD tests, serialized once for all of them
+TEST_GOAL = {"name": "Test Goal", "goal_type": "net_worth", "target_value": 50000}
+TEST_GOAL_JSON = json.dumps(TEST_GOAL)
+
+# Every goals test starts with the default net worth categories
+pytestmark = pytest.mark.usefixtures("default_categories")
+
 
 class TestGoalValidation:
     """Tests for goal input validation."""
@@ -191,8 +202,6 @@ class TestGoalCRUD:
 
     def test_create_savings_goal(self, client):
         """POST /api/goals creates a savings goal with category."""
-        client.post("/api/networth/categories/seed")
-
         response = client.post(
             "/api/goals",
             json={
@@ -246,8 +255,6 @@ class TestGoalCRUD:
 
     def test_list_goals(self, client):
         """GET /api/goals returns all goals."""
-        client.post("/api/networth/categories/seed")
-
         client.post(
             "/api/goals",
             json={
@@ -273,19 +280,15 @@ class TestGoalCRUD:
     def test_get_single_goal(self, client):
         """GET /api/goals/<id> returns specific goal."""
         create_response = client.post(
-            "/api/goals",
-            json={
-                "name": "Test Goal",
-                "goal_type": "net_worth",
-                "target_value": 50000,
-            },
+            "/api/goals", data=TEST_GOAL_JSON, content_type="application/json"
         )
         goal_id = create_response.json["id"]
 
         response = client.get(f"/api/goals/{goal_id}")
         assert response.status_code == 200
-        assert response.json["name"] == "Test Goal"
-        assert response.json["id"] == goal_id
+        data = response.json
+        assert data["name"] == "Test Goal"
+        assert data["id"] == goal_id
 
     def test_get_nonexistent_goal(self, client):
         """GET /api/goals/<id> returns 404 for nonexistent goal."""
@@ -311,12 +314,7 @@ class TestGoalCRUD:
     def test_update_goal_target_value(self, client):
         """PUT /api/goals/<id> updates target_value."""
         create_response = client.post(
-            "/api/goals",
-            json={
-                "name": "Test Goal",
-                "goal_type": "net_worth",
-                "target_value": 50000,
-            },
+            "/api/goals", data=TEST_GOAL_JSON, content_type="application/json"
         )
         goal_id = create_response.json["id"]
 
@@ -327,12 +325,7 @@ class TestGoalCRUD:
     def test_update_goal_add_target_date(self, client):
         """PUT /api/goals/<id> adds target_date."""
         create_response = client.post(
-            "/api/goals",
-            json={
-                "name": "Test Goal",
-                "goal_type": "net_worth",
-                "target_value": 50000,
-            },
+            "/api/goals", data=TEST_GOAL_JSON, content_type="application/json"
         )
         goal_id = create_response.json["id"]
 
@@ -347,12 +340,7 @@ class TestGoalCRUD:
         """PUT /api/goals/<id> removes target_date."""
         create_response = client.post(
             "/api/goals",
-            json={
-                "name": "Test Goal",
-                "goal_type": "net_worth",
-                "target_value": 50000,
-                "target_date": "2025-12-31T00:00:00+00:00",
-            },
+            json={**TEST_GOAL, "target_date": "2025-12-31T00:00:00+00:00"},
         )
         goal_id = create_response.json["id"]
 
@@ -363,12 +351,7 @@ class TestGoalCRUD:
     def test_update_goal_deactivate(self, client):
         """PUT /api/goals/<id> deactivates goal."""
         create_response = client.post(
-            "/api/goals",
-            json={
-                "name": "Test Goal",
-                "goal_type": "net_worth",
-                "target_value": 50000,
-            },
+            "/api/goals", data=TEST_GOAL_JSON, content_type="application/json"
         )
         goal_id = create_response.json["id"]
 
@@ -378,8 +361,6 @@ class TestGoalCRUD:
 
     def test_update_goal_category_id(self, client):
         """PUT /api/goals/<id> updates category_id."""
-        client.post("/api/networth/categories/seed")
-
         create_response = client.post(
             "/api/goals",
             json={
@@ -403,12 +384,7 @@ class TestGoalCRUD:
     def test_update_goal_no_body(self, client):
         """PUT /api/goals/<id> with no body returns 400."""
         create_response = client.post(
-            "/api/goals",
-            json={
-                "name": "Test Goal",
-                "goal_type": "net_worth",
-                "target_value": 50000,
-            },
+            "/api/goals", data=TEST_GOAL_JSON, content_type="application/json"
         )
         goal_id = create_response.json["id"]
 
@@ -418,12 +394,7 @@ class TestGoalCRUD:
     def test_delete_goal(self, client):
         """DELETE /api/goals/<id> deletes goal."""
         create_response = client.post(
-            "/api/goals",
-            json={
-                "name": "Test Goal",
-                "goal_type": "net_worth",
-                "target_value": 50000,
-            },
+            "/api/goals", data=TEST_GOAL_JSON, content_type="application/json"
         )
         goal_id = create_response.json["id"]
 
@@ -440,274 +411,161 @@ class TestGoalCRUD:
         assert response.status_code == 404
 
 
-class TestGoalProgress:
-    """Tests for goal progress calculation."""
-
-    def test_progress_empty(self, client):
-        """GET /api/goals/progress returns empty list when no active goals."""
-        response = client.get("/api/goals/progress")
-        assert response.status_code == 200
-        assert response.json == []
-
-    def test_progress_inactive_goals_excluded(self, client):
-        """GET /api/goals/progress excludes inactive goals."""
-        client.post(
-            "/api/goals",
-            json={
-                "name": "Inactive Goal",
-                "goal_type": "net_worth",
-                "target_value": 100000,
-                "is_active": False,
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        assert response.status_code == 200
-        assert response.json == []
-
-    def test_progress_net_worth_no_snapshot(self, client):
-        """GET /api/goals/progress with net_worth but no snapshots."""
-        client.post(
-            "/api/goals",
-            json={
-                "name": "100k Goal",
-                "goal_type": "net_worth",
-                "target_value": 100000,
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        assert response.status_code == 200
-        assert len(response.json) == 1
-
-        progress = response.json[0]
-        assert progress["current_value"] == 0
-        assert progress["target_value"] == 100000
-        assert progress["progress_percentage"] == 0
-        assert progress["is_achieved"] is False
-        assert progress["data_months"] == 0
-
-    def test_progress_net_worth_with_snapshot(self, client):
-        """GET /api/goals/progress with net_worth and snapshot data."""
-        client.post("/api/networth/categories/seed")
-
-        # Create a snapshot with net worth of 50000
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [
-                    {"category_id": 1, "amount": 60000},  # Cash asset
-                    {"category_id": 11, "amount": -10000},  # Loan liability
-                ],
-            },
-        )
-
-        client.post(
-            "/api/goals",
-            json={
-                "name": "100k Goal",
-                "goal_type": "net_worth",
-                "target_value": 100000,
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        assert response.status_code == 200
-        assert len(response.json) == 1
-
-        progress = response.json[0]
-        assert progress["current_value"] == 50000
-        assert progress["target_value"] == 100000
-        assert progress["progress_percentage"] == 50.0
-        assert progress["is_achieved"] is False
-
-    def test_progress_net_worth_achieved(self, client):
-        """GET /api/goals/progress when net_worth is achieved."""
-        client.post("/api/networth/categories/seed")
-
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [
-                    {"category_id": 1, "amount": 120000},
-                ],
-            },
-        )
-
-        client.post(
-            "/api/goals",
-            json={
-                "name": "100k Goal",
-                "goal_type": "net_worth",
-                "target_value": 100000,
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        progress = response.json[0]
-        assert progress["current_value"] == 120000
+# (setup_key, expected fields) for a single active goal; see progress_for
+PROGRESS_CASES = [
+    pytest.param(
+        (("goal", "net_worth", 100000),),
+        {
+            "current_value": 0,
+            "target_value": 100000,
+            "progress_percentage": 0,
+            "is_achieved": False,
+            "data_months": 0,
+        },
+        id="net_worth_no_snapshot",
+    ),
+    pytest.param(
+        (
+            ("snap", 1, 2025, 1, 60000),  # Cash asset
+            ("snap", 1, 2025, 11, -10000),  # Loan liability
+            ("goal", "net_worth", 100000),
+        ),
+        {
+            "current_value": 50000,
+            "target_value": 100000,
+            "progress_percentage": 50.0,
+            "is_achieved": False,
+        },
+        id="net_worth_with_snapshot",
+    ),
+    pytest.param(
+        (("snap", 1, 2025, 1, 120000), ("goal", "net_worth", 100000)),
         # Progress capped at 100%
-        assert progress["progress_percentage"] == 100.0
-        assert progress["is_achieved"] is True
-
-    def test_progress_savings_rate_no_income(self, client):
-        """GET /api/goals/progress with savings_rate but no income."""
-        client.post(
-            "/api/goals",
-            json={
-                "name": "20% Savings Rate",
-                "goal_type": "savings_rate",
-                "target_value": 20,
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        progress = response.json[0]
+        {"current_value": 120000, "progress_percentage": 100.0, "is_achieved": True},
+        id="net_worth_achieved",
+    ),
+    pytest.param(
+        (
+            ("snap", 1, 2024, 1, 30000),  # Older snapshot
+            ("snap", 6, 2024, 1, 50000),  # Newer snapshot
+            ("goal", "net_worth", 100000),
+        ),
+        # Should use June 2024 (50000), not January (30000)
+        {"current_value": 50000},
+        id="uses_latest_snapshot",
+    ),
+    pytest.param(
+        (
+            ("snap", 12, 2024, 1, 60000),
+            ("snap", 1, 2025, 1, 50000),
+            ("goal", "net_worth", 100000),
+        ),
+        # January 2025 is newer than December 2024 despite the lower month
+        {"current_value": 50000},
+        id="latest_snapshot_across_year_boundary",
+    ),
+    pytest.param(
+        (("goal", "savings_rate", 20),),
         # No income means 0 rate
-        assert progress["current_value"] == 0
-        assert progress["progress_percentage"] == 0
-        assert progress["is_achieved"] is False
-
-    def test_progress_savings_rate_with_income(self, client):
-        """GET /api/goals/progress calculates savings rate correctly."""
-        client.post("/api/networth/categories/seed")
-
-        # Create income: 5000 gross, 25% tax = 3750 net
-        client.post(
-            "/api/income",
-            json={"name": "Salary", "gross_amount": 5000, "is_taxed": True},
-        )
-
-        # Create snapshots showing 1000/month savings
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [{"category_id": 1, "amount": 10000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 2,
-                "year": 2025,
-                "entries": [{"category_id": 1, "amount": 11000}],  # +1000
-            },
-        )
-
-        client.post(
-            "/api/goals",
-            json={
-                "name": "20% Savings Rate",
-                "goal_type": "savings_rate",
-                "target_value": 20,
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        progress = response.json[0]
-        # 1000 / 3750 * 100 = 26.67%
-        # progress = 26.67 / 20 * 100 = exceeds target
-        assert 25 < progress["current_value"] < 28  # ~26.67%
-        assert progress["target_value"] == 20
-        assert progress["is_achieved"] is True  # 26.67% > 20%
-
-    def test_progress_savings_goal_no_snapshot(self, client):
-        """GET /api/goals/progress with savings_goal but no snapshots."""
-        client.post("/api/networth/categories/seed")
-
-        client.post(
-            "/api/goals",
-            json={
-                "name": "Vacation Fund",
-                "goal_type": "savings_goal",
-                "target_value": 5000,
-                "category_id": 1,
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        progress = response.json[0]
-        assert progress["current_value"] == 0
-        assert progress["target_value"] == 5000
-        assert progress["progress_percentage"] == 0
-        assert progress["is_achieved"] is False
-
-    def test_progress_savings_goal_with_snapshot(self, client):
-        """GET /api/goals/progress with savings_goal and snapshot."""
-        client.post("/api/networth/categories/seed")
+        {"current_value": 0, "progress_percentage": 0, "is_achieved": False},
+        id="savings_rate_no_income",
+    ),
+    pytest.param(
+        # Income: 5000 gross, 25% tax = 3750 net; snapshots show 1000/month
+        (
+            ("income", 5000),
+            ("snap", 1, 2025, 1, 10000),
+            ("snap", 2, 2025, 1, 11000),  # +1000
+            ("goal", "savings_rate", 20),
+        ),
+        # 1000 / 3750 * 100 = 26.67%, which exceeds the 20% target
+        {
+            "current_value": pytest.approx(26.67, abs=0.01),
+            "target_value": 20,
+            "is_achieved": True,
+        },
+        id="savings_rate_with_income",
+    ),
+    pytest.param(
+        (("goal", "savings_goal", 5000, (("category_id", 1),)),),
+        {
+            "current_value": 0,
+            "target_value": 5000,
+            "progress_percentage": 0,
+            "is_achieved": False,
+        },
+        id="savings_goal_no_snapshot",
+    ),
+    pytest.param(
+        (
+            ("snap", 1, 2025, 1, 2500),
+            ("goal", "savings_goal", 5000, (("category_id", 1),)),
+        ),
+        {
+            "current_value": 2500,
+            "target_value": 5000,
+            "progress_percentage": 50.0,
+            "is_achieved": False,
+            "category_name": "Checking",
+        },
+        id="savings_goal_with_snapshot",
+    ),
+]
+
+# (setup_key, expected status) for a single active goal
+STATUS_CASES = [
+    pytest.param((("goal", "net_worth", 100000),), None, id="no_target_date"),
+    pytest.param(
+        # Only 2 months of data, need 3+ for status
+        (
+            ("snap", 1, 2025, 1, 50000),
+            ("snap", 2, 2025, 1, 52000),
+            (
+                "goal",
+                "net_worth",
+                100000,
+                (("target_date", "2026-12-31T00:00:00+00:00"),),
+            ),
+        ),
+        None,
+        id="not_enough_data",
+    ),
+]
 
-        # Create snapshot with category 1 having 2500
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [
-                    {"category_id": 1, "amount": 2500},
-                ],
-            },
-        )
 
-        client.post(
-            "/api/goals",
-            json={
-                "name": "Vacation Fund",
-                "goal_type": "savings_goal",
-                "target_value": 5000,
-                "category_id": 1,
-            },
-        )
+class TestGoalProgress:
+    """Tests for goal progress calculation."""
 
-        response = client.get("/api/goals/progress")
-        progress = response.json[0]
-        assert progress["current_value"] == 2500
-        assert progress["target_value"] == 5000
-        assert progress["progress_percentage"] == 50.0
-        assert progress["is_achieved"] is False
-        assert progress["category_name"] is not None
+    def test_progress_empty(self, progress_for):
+        """GET /api/goals/progress returns empty list when no active goals."""
+        assert progress_for(()) == []
 
-    def test_progress_multiple_goals(self, client):
+    def test_progress_inactive_goals_excluded(self, progress_for):
+        """GET /api/goals/progress excludes inactive goals."""
+        data = progress_for((("goal", "net_worth", 100000, (("is_active", False),)),))
+        assert data == []
+
+    @pytest.mark.parametrize("setup_key,expected", PROGRESS_CASES)
+    def test_progress_single_goal(self, progress_for, setup_key, expected):
+        """GET /api/goals/progress reports the expected values for one goal."""
+        data = progress_for(setup_key)
+        assert len(data) == 1
+        progress = data[0]
+        assert {key: progress[key] for key in expected} == expected
+
+    def test_progress_multiple_goals(self, progress_for):
         """GET /api/goals/progress returns progress for all active goals."""
-        client.post("/api/networth/categories/seed")
-
-        client.post(
-            "/api/goals",
-            json={
-                "name": "Net Worth Goal",
-                "goal_type": "net_worth",
-                "target_value": 100000,
-            },
-        )
-        client.post(
-            "/api/goals",
-            json={
-                "name": "Savings Rate",
-                "goal_type": "savings_rate",
-                "target_value": 20,
-            },
-        )
-        client.post(
-            "/api/goals",
-            json={
-                "name": "Vacation Fund",
-                "goal_type": "savings_goal",
-                "target_value": 5000,
-                "category_id": 1,
-            },
+        data = progress_for(
+            (
+                ("goal", "net_worth", 100000),
+                ("goal", "savings_rate", 20),
+                ("goal", "savings_goal", 5000, (("category_id", 1),)),
+            )
         )
-
-        response = client.get("/api/goals/progress")
-        assert response.status_code == 200
-        assert len(response.json) == 3
+        assert len(data) == 3
 
         # Each should have required fields
-        for progress in response.json:
+        for progress in data:
             assert "goal" in progress
             assert "current_value" in progress
             assert "target_value" in progress
@@ -716,96 +574,25 @@ class TestGoalProgress:
             assert "status" in progress
             assert "data_months" in progress
 
-    def test_progress_uses_latest_snapshot(self, client):
-        """GET /api/goals/progress uses the most recent snapshot."""
-        client.post("/api/networth/categories/seed")
-
-        # Create older snapshot
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": 1, "amount": 30000}],
-            },
-        )
-
-        # Create newer snapshot
-        client.post(
-            "/api/networth",
-            json={
-                "month": 6,
-                "year": 2024,
-                "entries": [{"category_id": 1, "amount": 50000}],
-            },
-        )
-
-        client.post(
-            "/api/goals",
-            json={
-                "name": "100k Goal",
-                "goal_type": "net_worth",
-                "target_value": 100000,
-            },
+    def test_progress_savings_goals_per_category(self, progress_for):
+        """GET /api/goals/progress reads each savings_goal's own category."""
+        data = progress_for(
+            (
+                ("snap", 1, 2025, 1, 2500),
+                ("snap", 1, 2025, 2, 4000),
+                ("goal", "savings_goal", 5000, (("category_id", 1),)),
+                ("goal", "savings_goal", 5000, (("category_id", 2),)),
+                ("goal", "savings_goal", 5000, (("category_id", 3),)),
+            )
         )
-
-        response = client.get("/api/goals/progress")
-        progress = response.json[0]
-        # Should use June 2024 (50000), not January (30000)
-        assert progress["current_value"] == 50000
+        by_category = {p["goal"]["category_id"]: p["current_value"] for p in data}
+        assert by_category == {1: 2500, 2: 4000, 3: 0}
 
 
 class TestGoalStatus:
     """Tests for on-track/behind status calculation."""
 
-    def test_status_no_target_date(self, client):
-        """Status is None when no target_date is set."""
-        client.post(
-            "/api/goals",
-            json={
-                "name": "100k Goal",
-                "goal_type": "net_worth",
-                "target_value": 100000,
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        progress = response.json[0]
-        assert progress["status"] is None
-
-    def test_status_not_enough_data(self, client):
-        """Status is None when less than 3 months of data."""
-        client.post("/api/networth/categories/seed")
-
-        # Only 2 snapshots
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [{"category_id": 1, "amount": 50000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 2,
-                "year": 2025,
-                "entries": [{"category_id": 1, "amount": 52000}],
-            },
-        )
-
-        client.post(
-            "/api/goals",
-            json={
-                "name": "100k Goal",
-                "goal_type": "net_worth",
-                "target_value": 100000,
-                "target_date": "2026-12-31T00:00:00+00:00",
-            },
-        )
-
-        response = client.get("/api/goals/progress")
-        progress = response.json[0]
-        # Only 2 months of data, need 3+ for status
-        assert progress["status"] is None
+    @pytest.mark.parametrize("setup_key,expected", STATUS_CASES)
+    def test_status(self, progress_for, setup_key, expected):
+        """Status is None without a target_date or with under 3 months of data."""
+        assert progress_for(setup_key)[0]["status"] is expected
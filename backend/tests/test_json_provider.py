@@ -0,0 +1,60 @@
+"""Tests for the orjson-backed JSON provider."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+
+COMPACT_CASES = [
+    pytest.param({"b": 1, "a": Decimal("1.50")}, id="sorted_keys_decimal"),
+    pytest.param({"name": "Säästötili"}, id="non_ascii"),
+    pytest.param({"at": datetime(2024, 1, 2, 3, 4, 5)}, id="datetime"),
+    pytest.param({1: "a"}, id="int_key"),
+    pytest.param([2**70], id="big_int"),
+]
+
+
+class TestOrjsonProvider:
+    """Tests for OrjsonProvider against Flask's default provider."""
+
+    @pytest.mark.parametrize("obj", COMPACT_CASES)
+    def test_dumps_matches_default_provider(self, app, obj):
+        """Compact output matches Flask's provider with ensure_ascii off."""
+        expected = DefaultJSONProvider(app).dumps(
+            obj, ensure_ascii=False, separators=(",", ":")
+        )
+        assert app.json.dumps(obj, separators=(",", ":")) == expected
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"indent": 2}, id="indent_2"),
+            pytest.param({"indent": 4}, id="indent_4"),
+            pytest.param(
+                {"ensure_ascii": True, "separators": (",", ":")}, id="ensure_ascii"
+            ),
+            pytest.param({"sort_keys": False, "separators": (",", ":")}, id="unsorted"),
+        ],
+    )
+    def test_dumps_honours_arguments(self, app, kwargs):
+        """json.dumps arguments give the same output as Flask's provider."""
+        obj = {"b": ["ä"], "a": 1}
+        expected = DefaultJSONProvider(app).dumps(
+            obj, **{"ensure_ascii": False, **kwargs}
+        )
+        assert app.json.dumps(obj, **kwargs) == expected
+
+    def test_dumps_unserializable_raises_type_error(self, app):
+        """Values neither encoder handles raise Flask's TypeError."""
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            app.json.dumps({"value": object()})
+
+    def test_dumps_nan_as_null(self, app):
+        """Float NaN is written as null rather than invalid JSON."""
+        assert app.json.dumps([float("nan")]) == "[null]"
+
+    def test_loads_rejects_nan(self, app):
+        """NaN in a request body is invalid JSON."""
+        with pytest.raises(ValueError):
+            app.json.loads("[NaN]")
@@ -1,9 +1,10 @@
 """Tests for database migrations system."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from app import migrations
 from app.migrations import (
     MIGRATIONS,
     _apply_migration,
@@ -12,6 +13,20 @@ from app.migrations import (
 )
 
 
+@pytest.fixture(scope="class")
+def make_session():
+    """Return a factory for mock sessions bound to a given dialect."""
+
+    def _make(dialect="postgresql", applied=()):
+        session = MagicMock()
+        session.bind.dialect.name = dialect
+        result = session.execute.return_value
+        result.fetchall.return_value = [(migration_id,) for migration_id in applied]
+        return session
+
+    return _make
+
+
 class TestMigrationSystem:
     """Tests for the migration infrastructure."""
 
@@ -20,30 +35,29 @@ class TestMigrationSystem:
         ids = [m["id"] for m in MIGRATIONS]
         assert len(ids) == len(set(ids)), "Duplicate migration IDs found"
 
-    def test_migrations_have_required_fields(self):
+    @pytest.mark.parametrize(
+        "migration", MIGRATIONS, ids=[m.get("id", "?") for m in MIGRATIONS]
+    )
+    def test_migration_has_required_fields(self, migration):
         """Each migration must have id, name, and sql fields."""
-        for migration in MIGRATIONS:
-            assert "id" in migration, f"Migration missing 'id': {migration}"
-            assert "name" in migration, f"Migration missing 'name': {migration}"
-            assert "sql" in migration, f"Migration missing 'sql': {migration}"
-            assert migration["id"].strip(), "Migration ID cannot be empty"
-            assert migration["name"].strip(), "Migration name cannot be empty"
-            assert migration["sql"].strip(), "Migration SQL cannot be empty"
-
-    def test_get_applied_migrations_returns_set(self):
+        assert "id" in migration, f"Migration missing 'id': {migration}"
+        assert "name" in migration, f"Migration missing 'name': {migration}"
+        assert "sql" in migration, f"Migration missing 'sql': {migration}"
+        assert migration["id"].strip(), "Migration ID cannot be empty"
+        assert migration["name"].strip(), "Migration name cannot be empty"
+        assert migration["sql"].strip(), "Migration SQL cannot be empty"
+
+    def test_get_applied_migrations_returns_set(self, make_session):
         """_get_applied_migrations should return a set of IDs."""
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("001_test",), ("002_test",)]
-        mock_session.execute.return_value = mock_result
+        mock_session = make_session(applied=["001_test", "002_test"])
 
         result = _get_applied_migrations(mock_session)
 
         assert result == {"001_test", "002_test"}
 
-    def test_apply_migration_executes_sql_and_records(self):
+    def test_apply_migration_executes_sql_and_records(self, make_session):
         """_apply_migration should execute SQL and record the migration."""
-        mock_session = MagicMock()
+        mock_session = make_session()
         migration = {
             "id": "test_migration",
             "name": "Test migration",
@@ -57,9 +71,9 @@ class TestMigrationSystem:
         # Should have committed
         mock_session.commit.assert_called_once()
 
-    def test_apply_migration_rolls_back_on_error(self):
+    def test_apply_migration_rolls_back_on_error(self, make_session):
         """_apply_migration should rollback on error."""
-        mock_session = MagicMock()
+        mock_session = make_session()
         mock_session.execute.side_effect = Exception("Database error")
         migration = {
             "id": "test_migration",
@@ -72,12 +86,9 @@ class TestMigrationSystem:
 
         mock_session.rollback.assert_called_once()
 
-    def test_run_migrations_skips_sqlite(self):
+    def test_run_migrations_skips_sqlite(self, make_session):
         """run_migrations should skip SQLite databases."""
-        mock_session = MagicMock()
-        mock_bind = MagicMock()
-        mock_bind.dialect.name = "sqlite"
-        mock_session.bind = mock_bind
+        mock_session = make_session("sqlite")
 
         count = run_migrations(mock_session)
 
@@ -85,67 +96,59 @@ class TestMigrationSystem:
         # Should not have tried to create migration table
         mock_session.execute.assert_not_called()
 
-    def test_run_migrations_skips_already_applied(self):
+    def test_run_migrations_skips_already_applied(self, make_session, monkeypatch):
         """run_migrations should skip already-applied migrations."""
-        mock_session = MagicMock()
-        mock_bind = MagicMock()
-        mock_bind.dialect.name = "postgresql"
-        mock_session.bind = mock_bind
+        mock_session = make_session()
 
         # Mock _get_applied_migrations to return all migration IDs
         all_ids = {m["id"] for m in MIGRATIONS}
+        mock_apply = Mock()
+        monkeypatch.setattr(migrations, "_get_applied_migrations", lambda _: all_ids)
+        monkeypatch.setattr(migrations, "_ensure_migrations_table", lambda _: None)
+        monkeypatch.setattr(migrations, "_apply_migration", mock_apply)
 
-        with patch("app.migrations._get_applied_migrations", return_value=all_ids):
-            with patch("app.migrations._ensure_migrations_table"):
-                with patch("app.migrations._apply_migration") as mock_apply:
-                    count = run_migrations(mock_session)
+        count = run_migrations(mock_session)
 
         assert count == 0
         mock_apply.assert_not_called()
 
-    def test_run_migrations_applies_pending(self):
+    def test_run_migrations_applies_pending(self, make_session, monkeypatch):
         """run_migrations should apply pending migrations."""
         if not MIGRATIONS:
             return  # Skip if no migrations defined
 
-        mock_session = MagicMock()
-        mock_bind = MagicMock()
-        mock_bind.dialect.name = "postgresql"
-        mock_session.bind = mock_bind
+        mock_session = make_session()
 
         # Mock no migrations applied yet
-        with patch("app.migrations._get_applied_migrations", return_value=set()):
-            with patch("app.migrations._ensure_migrations_table"):
-                with patch("app.migrations._apply_migration") as mock_apply:
-                    count = run_migrations(mock_session)
+        mock_apply = Mock()
+        monkeypatch.setattr(migrations, "_get_applied_migrations", lambda _: set())
+        monkeypatch.setattr(migrations, "_ensure_migrations_table", lambda _: None)
+        monkeypatch.setattr(migrations, "_apply_migration", mock_apply)
+
+        count = run_migrations(mock_session)
 
         assert count == len(MIGRATIONS)
         assert mock_apply.call_count == len(MIGRATIONS)
 
-    def test_run_migrations_is_idempotent(self):
+    def test_run_migrations_is_idempotent(self, make_session, monkeypatch):
         """Running migrations twice should only apply each once."""
-        mock_session = MagicMock()
-        mock_bind = MagicMock()
-        mock_bind.dialect.name = "postgresql"
-        mock_session.bind = mock_bind
+        mock_session = make_session()
 
         applied = set()
 
-        def mock_get_applied(_):
-            return applied.copy()
-
         def mock_apply(_, migration):
             applied.add(migration["id"])
 
-        with patch(
-            "app.migrations._get_applied_migrations", side_effect=mock_get_applied
-        ):
-            with patch("app.migrations._ensure_migrations_table"):
-                with patch("app.migrations._apply_migration", side_effect=mock_apply):
-                    # First run
-                    count1 = run_migrations(mock_session)
-                    # Second run
-                    count2 = run_migrations(mock_session)
+        monkeypatch.setattr(
+            migrations, "_get_applied_migrations", lambda _: applied.copy()
+        )
+        monkeypatch.setattr(migrations, "_ensure_migrations_table", lambda _: None)
+        monkeypatch.setattr(migrations, "_apply_migration", mock_apply)
+
+        # First run
+        count1 = run_migrations(mock_session)
+        # Second run
+        count2 = run_migrations(mock_session)
 
         assert count1 == len(MIGRATIONS)
         assert count2 == 0  # Nothing to apply on second run
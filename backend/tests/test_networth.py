@@ -1,7 +1,17 @@
 """Tests for net worth API endpoints."""
 
+import json
+from decimal import Decimal
+
 import pytest
 
+from app import get_session
+from app.models import NetWorthCategory, NetWorthEntry, NetWorthGroup, NetWorthSnapshot
+from app.routes.networth import _parse_forecast_params, add_default_categories
+
+# Snapshot without entries, serialized once for the tests that post it
+EMPTY_SNAPSHOT_JSON = json.dumps({"month": 1, "year": 2024})
+
 # =============================================================================
 # Group Tests
 # =============================================================================
@@ -37,9 +47,24 @@ class TestGroupList:
 
         response = client.get("/api/networth/groups")
         assert response.status_code == 200
-        assert len(response.json) == 2
-        assert response.json[0]["name"] == "First"
-        assert response.json[1]["name"] == "Second"
+        data = response.json
+        assert len(data) == 2
+        assert data[0]["name"] == "First"
+        assert data[1]["name"] == "Second"
+
+
+GROUP_VALIDATION_CASES = [
+    pytest.param({"group_type": "asset"}, "name", id="missing_name"),
+    pytest.param({"name": "Test"}, "group_type", id="missing_type"),
+    pytest.param(
+        {"name": "Test", "group_type": "invalid"}, "group_type", id="invalid_type"
+    ),
+    pytest.param(
+        {"name": "Test", "group_type": "asset", "color": "invalid"},
+        "color",
+        id="invalid_color",
+    ),
+]
 
 
 class TestGroupCreate:
@@ -81,41 +106,12 @@ class TestGroupCreate:
         assert data["color"] == "#3b82f6"
         assert data["display_order"] == 10
 
-    def test_create_group_missing_name(self, client):
-        """POST /api/networth/groups requires name."""
-        response = client.post(
-            "/api/networth/groups",
-            json={"group_type": "asset"},
-        )
+    @pytest.mark.parametrize("payload,error", GROUP_VALIDATION_CASES)
+    def test_create_group_validation(self, client, payload, error):
+        """POST /api/networth/groups rejects invalid payloads."""
+        response = client.post("/api/networth/groups", json=payload)
         assert response.status_code == 400
-        assert "name" in response.json["error"].lower()
-
-    def test_create_group_missing_type(self, client):
-        """POST /api/networth/groups requires group_type."""
-        response = client.post(
-            "/api/networth/groups",
-            json={"name": "Test"},
-        )
-        assert response.status_code == 400
-        assert "group_type" in response.json["error"].lower()
-
-    def test_create_group_invalid_type(self, client):
-        """POST /api/networth/groups validates group_type."""
-        response = client.post(
-            "/api/networth/groups",
-            json={"name": "Test", "group_type": "invalid"},
-        )
-        assert response.status_code == 400
-        assert "group_type" in response.json["error"].lower()
-
-    def test_create_group_invalid_color(self, client):
-        """POST /api/networth/groups validates color format."""
-        response = client.post(
-            "/api/networth/groups",
-            json={"name": "Test", "group_type": "asset", "color": "invalid"},
-        )
-        assert response.status_code == 400
-        assert "color" in response.json["error"].lower()
+        assert error in response.json["error"].lower()
 
 
 class TestGroupUpdate:
@@ -137,8 +133,9 @@ class TestGroupUpdate:
             json={"name": "New Name", "color": "#ef4444"},
         )
         assert response.status_code == 200
-        assert response.json["name"] == "New Name"
-        assert response.json["color"] == "#ef4444"
+        data = response.json
+        assert data["name"] == "New Name"
+        assert data["color"] == "#ef4444"
 
     def test_update_group_not_found(self, client):
         """PUT /api/networth/groups/<id> returns 404 for non-existent."""
@@ -195,10 +192,10 @@ class TestGroupDelete:
 # =============================================================================
 
 
-@pytest.fixture
-def asset_group(client):
-    """Create an asset group for testing."""
-    response = client.post(
+@pytest.fixture(scope="class")
+def asset_group(class_client):
+    """Create an asset group shared by the tests in a class."""
+    response = class_client.post(
         "/api/networth/groups",
         json={"name": "Cash", "group_type": "asset"},
     )
@@ -246,9 +243,17 @@ class TestCategoryList:
 
         response = client.get("/api/networth/categories")
         assert response.status_code == 200
-        assert len(response.json) == 2
-        assert response.json[0]["name"] == "First"
-        assert response.json[1]["name"] == "Second"
+        data = response.json
+        assert len(data) == 2
+        assert data[0]["name"] == "First"
+        assert data[1]["name"] == "Second"
+
+
+CATEGORY_GROUP_CASES = [
+    pytest.param({"name": "Test"}, "group_id", id="missing_group"),
+    pytest.param({"name": "Test", "group_id": "abc"}, "group_id", id="group_not_int"),
+    pytest.param({"name": "Test", "group_id": 999}, "group", id="invalid_group"),
+]
 
 
 class TestCategoryCreate:
@@ -299,23 +304,12 @@ class TestCategoryCreate:
         assert response.status_code == 400
         assert "name" in response.json["error"].lower()
 
-    def test_create_category_missing_group(self, client):
-        """POST /api/networth/categories requires group_id."""
-        response = client.post(
-            "/api/networth/categories",
-            json={"name": "Test"},
-        )
+    @pytest.mark.parametrize("payload,error", CATEGORY_GROUP_CASES)
+    def test_create_category_group_validation(self, client, payload, error):
+        """POST /api/networth/categories requires an existing group_id."""
+        response = client.post("/api/networth/categories", json=payload)
         assert response.status_code == 400
-        assert "group_id" in response.json["error"].lower()
-
-    def test_create_category_invalid_group(self, client):
-        """POST /api/networth/categories validates group_id exists."""
-        response = client.post(
-            "/api/networth/categories",
-            json={"name": "Test", "group_id": 999},
-        )
-        assert response.status_code == 400
-        assert "group" in response.json["error"].lower()
+        assert error in response.json["error"].lower()
 
     def test_create_category_name_too_long(self, client, asset_group):
         """POST /api/networth/categories rejects name > 100 chars."""
@@ -355,8 +349,9 @@ class TestCategoryUpdate:
             json={"name": "New Name", "display_order": 5},
         )
         assert response.status_code == 200
-        assert response.json["name"] == "New Name"
-        assert response.json["display_order"] == 5
+        data = response.json
+        assert data["name"] == "New Name"
+        assert data["display_order"] == 5
 
     def test_update_category_not_found(self, client):
         """PUT /api/networth/categories/<id> returns 404 for non-existent."""
@@ -401,7 +396,7 @@ class TestCategoryDelete:
         response = client.delete("/api/networth/categories/999")
         assert response.status_code == 404
 
-    def test_delete_category_in_use(self, client, asset_group):
+    def test_delete_category_in_use(self, client, asset_group, snapshot_factory):
         """DELETE /api/networth/categories/<id> fails if category is used."""
         # Create category
         cat_response = client.post(
@@ -411,14 +406,7 @@ class TestCategoryDelete:
         category_id = cat_response.json["id"]
 
         # Create snapshot using this category
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": category_id, "amount": 1000}],
-            },
-        )
+        snapshot_factory(1, 2024, [(category_id, 1000)])
 
         # Try to delete category
         response = client.delete(f"/api/networth/categories/{category_id}")
@@ -433,8 +421,9 @@ class TestCategorySeed:
         """POST /api/networth/categories/seed creates default groups and categories."""
         response = client.post("/api/networth/categories/seed")
         assert response.status_code == 201
-        assert response.json["groups"] == 6
-        assert response.json["categories"] == 11
+        data = response.json
+        assert data["groups"] == 6
+        assert data["categories"] == 11
 
     def test_seed_categories_already_exists(self, client):
         """POST /api/networth/categories/seed fails if groups/categories exist."""
@@ -449,12 +438,17 @@ class TestCategorySeed:
 # =============================================================================
 
 
-@pytest.fixture
-def seeded_categories(client):
-    """Fixture that seeds default categories and returns category lookup."""
-    client.post("/api/networth/categories/seed")
-    response = client.get("/api/networth/categories")
-    return {c["name"]: c for c in response.json}
+@pytest.fixture(scope="class")
+def seeded_categories(class_client):
+    """Seed default categories once per class and return their ids by name.
+
+    Rows are inserted directly in the class-wide SAVEPOINT rather than through
+    the seed endpoint, which TestCategorySeed covers.
+    """
+    session = get_session()
+    add_default_categories(session)
+    session.commit()
+    return {c.name: c.id for c in session.query(NetWorthCategory)}
 
 
 class TestSnapshotList:
@@ -466,34 +460,19 @@ class TestSnapshotList:
         assert response.status_code == 200
         assert response.json == []
 
-    def test_list_snapshots_sorted_desc(self, client, seeded_categories):
+    def test_list_snapshots_sorted_desc(
+        self, client, seeded_categories, bulk_snapshots
+    ):
         """GET /api/networth returns snapshots sorted by date descending."""
-        cats = seeded_categories
-        cash_id = cats["Checking"]["id"]
+        cash_id = seeded_categories["Checking"]
 
-        client.post(
-            "/api/networth",
-            json={
-                "month": 3,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 1000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 500}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 2,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 750}],
-            },
+        # Inserted out of order so the sort cannot rely on insertion order
+        bulk_snapshots(
+            [
+                (3, 2024, cash_id, 1000),
+                (1, 2024, cash_id, 500),
+                (2, 2024, cash_id, 750),
+            ]
         )
 
         response = client.get("/api/networth")
@@ -509,17 +488,12 @@ class TestSnapshotList:
 class TestSnapshotGet:
     """Tests for getting specific snapshot."""
 
-    def test_get_snapshot_by_year_month(self, client, seeded_categories):
+    def test_get_snapshot_by_year_month(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """GET /api/networth/<year>/<month> returns specific snapshot."""
-        cash_id = seeded_categories["Checking"]["id"]
-        client.post(
-            "/api/networth",
-            json={
-                "month": 6,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 5000}],
-            },
-        )
+        cash_id = seeded_categories["Checking"]
+        snapshot_factory(6, 2024, [(cash_id, 5000)])
 
         response = client.get("/api/networth/2024/6")
         assert response.status_code == 200
@@ -535,13 +509,64 @@ class TestSnapshotGet:
         response = client.get("/api/networth/2024/1")
         assert response.status_code == 404
 
-    def test_get_snapshot_invalid_month(self, client):
+    @pytest.mark.parametrize("month", [0, 13])
+    def test_get_snapshot_invalid_month(self, client, month):
         """GET /api/networth/<year>/<month> validates month range."""
-        response = client.get("/api/networth/2024/13")
-        assert response.status_code == 400
-
-        response = client.get("/api/networth/2024/0")
+        response = client.get(f"/api/networth/2024/{month}")
         assert response.status_code == 400
+        assert "month" in response.json["error"]
+
+
+# (payload, expected error substring) for POST /api/networth validation
+SNAPSHOT_VALIDATION_CASES = [
+    pytest.param({"year": 2024}, "month", id="missing_month"),
+    pytest.param({"month": 1}, "year", id="missing_year"),
+    pytest.param({"month": 13, "year": 2024}, "month", id="month_above_range"),
+    pytest.param({"month": 0, "year": 2024}, "month", id="month_below_range"),
+    pytest.param({"month": "abc", "year": 2024}, "month", id="month_not_integer"),
+    pytest.param({"month": 1, "year": 1800}, "year", id="year_out_of_range"),
+    pytest.param(
+        {"month": 1, "year": 2024, "entries": {}}, "entries", id="entries_not_list"
+    ),
+    pytest.param(
+        {"month": 1, "year": 2024, "entries": [{"amount": 1000}]},
+        "category_id",
+        id="entry_missing_category",
+    ),
+    pytest.param(
+        {"month": 1, "year": 2024, "entries": [{"category_id": 999, "amount": 1000}]},
+        "category",
+        id="invalid_category",
+    ),
+    pytest.param(
+        {"month": 1, "year": 2024, "entries": [{"category_id": 1, "amount": "abc"}]},
+        "number",
+        id="amount_not_number",
+    ),
+    pytest.param(
+        {"month": 1, "year": 2024, "entries": [{"category_id": 1, "amount": True}]},
+        "number",
+        id="amount_bool",
+    ),
+    pytest.param(
+        {
+            "month": 1,
+            "year": 2024,
+            "entries": [{"category_id": 1, "amount": 1_000_000_001}],
+        },
+        "exceeds",
+        id="amount_exceeds_max",
+    ),
+    pytest.param(
+        {
+            "month": 1,
+            "year": 2024,
+            "entries": [{"category_id": 1, "amount": -1_000_000_001}],
+        },
+        "exceeds",
+        id="negative_amount_exceeds_max",
+    ),
+]
 
 
 class TestSnapshotCreate:
@@ -549,7 +574,9 @@ class TestSnapshotCreate:
 
     def test_create_snapshot_minimal(self, client):
         """POST /api/networth creates snapshot with just month/year."""
-        response = client.post("/api/networth", json={"month": 1, "year": 2024})
+        response = client.post(
+            "/api/networth", data=EMPTY_SNAPSHOT_JSON, content_type="application/json"
+        )
         assert response.status_code == 201
         data = response.json
 
@@ -569,9 +596,9 @@ class TestSnapshotCreate:
                 "month": 6,
                 "year": 2024,
                 "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 5000},
-                    {"category_id": cats["Savings"]["id"], "amount": 10000},
-                    {"category_id": cats["Student Loan"]["id"], "amount": -5000},
+                    {"category_id": cats["Checking"], "amount": 5000},
+                    {"category_id": cats["Savings"], "amount": 10000},
+                    {"category_id": cats["Student Loan"], "amount": -5000},
                 ],
             },
         )
@@ -583,35 +610,28 @@ class TestSnapshotCreate:
         assert data["total_liabilities"] == -5000.0
         assert data["net_worth"] == 10000.0
 
-    def test_create_snapshot_missing_month(self, client):
-        """POST /api/networth requires month."""
-        response = client.post("/api/networth", json={"year": 2024})
-        assert response.status_code == 400
-        assert "month" in response.json["error"].lower()
-
-    def test_create_snapshot_missing_year(self, client):
-        """POST /api/networth requires year."""
-        response = client.post("/api/networth", json={"month": 1})
+    @pytest.mark.parametrize("payload,error", SNAPSHOT_VALIDATION_CASES)
+    def test_create_snapshot_validation(self, client, payload, error):
+        """POST /api/networth rejects invalid input with a descriptive error."""
+        response = client.post("/api/networth", json=payload)
         assert response.status_code == 400
-        assert "year" in response.json["error"].lower()
+        assert error in response.json["error"].lower()
 
-    def test_create_snapshot_invalid_month(self, client):
-        """POST /api/networth validates month range."""
-        response = client.post("/api/networth", json={"month": 13, "year": 2024})
-        assert response.status_code == 400
-
-        response = client.post("/api/networth", json={"month": 0, "year": 2024})
-        assert response.status_code == 400
-
-    def test_create_snapshot_duplicate(self, client):
+    def test_create_snapshot_duplicate(self, client, snapshot_factory):
         """POST /api/networth rejects duplicate year/month."""
-        client.post("/api/networth", json={"month": 1, "year": 2024})
+        snapshot_factory()
 
-        response = client.post("/api/networth", json={"month": 1, "year": 2024})
+        response = client.post(
+            "/api/networth", data=EMPTY_SNAPSHOT_JSON, content_type="application/json"
+        )
         assert response.status_code == 409
 
-    def test_create_snapshot_invalid_category(self, client):
-        """POST /api/networth rejects invalid category_id."""
+    def test_create_snapshot_duplicate_before_category_check(
+        self, client, snapshot_factory
+    ):
+        """POST /api/networth reports a duplicate month before unknown categories."""
+        snapshot_factory()
+
         response = client.post(
             "/api/networth",
             json={
@@ -620,22 +640,20 @@ class TestSnapshotCreate:
                 "entries": [{"category_id": 999, "amount": 1000}],
             },
         )
-        assert response.status_code == 400
-        assert "category" in response.json["error"].lower()
+        assert response.status_code == 409
 
-    def test_create_snapshot_amount_exceeds_max(self, client, seeded_categories):
-        """POST /api/networth rejects amount > 1 billion."""
-        cash_id = seeded_categories["Checking"]["id"]
+    def test_create_snapshot_invalid_category_not_saved(self, client):
+        """POST /api/networth with an unknown category leaves no snapshot."""
         response = client.post(
             "/api/networth",
             json={
                 "month": 1,
                 "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 1_000_000_001}],
+                "entries": [{"category_id": 999, "amount": 1000}],
             },
         )
         assert response.status_code == 400
-        assert "exceeds" in response.json["error"].lower()
+        assert client.get("/api/networth").json == []
 
     def test_create_snapshot_no_body(self, client):
         """POST /api/networth with no body returns 400."""
@@ -646,25 +664,17 @@ class TestSnapshotCreate:
 class TestSnapshotUpdate:
     """Tests for updating snapshots."""
 
-    def test_update_snapshot_entries(self, client, seeded_categories):
+    def test_update_snapshot_entries(self, client, seeded_categories, snapshot_factory):
         """PUT /api/networth/<id> updates entries."""
         cats = seeded_categories
-        create_response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 1000}],
-            },
-        )
-        snapshot_id = create_response.json["id"]
+        snapshot_id = snapshot_factory(entries=[(cats["Checking"], 1000)])
 
         response = client.put(
             f"/api/networth/{snapshot_id}",
             json={
                 "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 2000},
-                    {"category_id": cats["Savings"]["id"], "amount": 5000},
+                    {"category_id": cats["Checking"], "amount": 2000},
+                    {"category_id": cats["Savings"], "amount": 5000},
                 ]
             },
         )
@@ -674,15 +684,36 @@ class TestSnapshotUpdate:
         assert len(data["entries"]) == 2
         assert data["net_worth"] == 7000.0
 
+    def test_update_snapshot_invalid_category(
+        self, client, seeded_categories, snapshot_factory
+    ):
+        """PUT /api/networth/<id> rejects unknown categories and keeps entries."""
+        cash_id = seeded_categories["Checking"]
+        snapshot_id = snapshot_factory(entries=[(cash_id, 1000)])
+
+        response = client.put(
+            f"/api/networth/{snapshot_id}",
+            json={
+                "entries": [
+                    {"category_id": cash_id, "amount": 2000},
+                    {"category_id": 999, "amount": 5000},
+                ]
+            },
+        )
+        assert response.status_code == 400
+        assert "999" in response.json["error"]
+
+        response = client.get("/api/networth/2024/1")
+        assert response.json["entries"][0]["amount"] == 1000.0
+
     def test_update_snapshot_not_found(self, client):
         """PUT /api/networth/<id> returns 404 for non-existent."""
         response = client.put("/api/networth/999", json={"entries": []})
         assert response.status_code == 404
 
-    def test_update_snapshot_change_month_year(self, client):
+    def test_update_snapshot_change_month_year(self, client, snapshot_factory):
         """PUT /api/networth/<id> can change month/year if no conflict."""
-        create_response = client.post("/api/networth", json={"month": 1, "year": 2024})
-        snapshot_id = create_response.json["id"]
+        snapshot_id = snapshot_factory(month=1, year=2024)
 
         response = client.put(
             f"/api/networth/{snapshot_id}", json={"month": 2, "year": 2024}
@@ -690,11 +721,10 @@ class TestSnapshotUpdate:
         assert response.status_code == 200
         assert response.json["month"] == 2
 
-    def test_update_snapshot_month_year_conflict(self, client):
+    def test_update_snapshot_month_year_conflict(self, client, snapshot_factory):
         """PUT /api/networth/<id> rejects if new month/year would conflict."""
-        client.post("/api/networth", json={"month": 1, "year": 2024})
-        create_response = client.post("/api/networth", json={"month": 2, "year": 2024})
-        snapshot_id = create_response.json["id"]
+        snapshot_factory(month=1, year=2024)
+        snapshot_id = snapshot_factory(month=2, year=2024)
 
         response = client.put(
             f"/api/networth/{snapshot_id}", json={"month": 1, "year": 2024}
@@ -705,187 +735,107 @@ class TestSnapshotUpdate:
 class TestSnapshotDelete:
     """Tests for deleting snapshots."""
 
-    def test_delete_snapshot(self, client):
+    def test_delete_snapshot(self, client, snapshot_factory):
         """DELETE /api/networth/<id> removes snapshot."""
-        create_response = client.post("/api/networth", json={"month": 1, "year": 2024})
-        snapshot_id = create_response.json["id"]
+        snapshot_id = snapshot_factory(month=1, year=2024)
 
         response = client.delete(f"/api/networth/{snapshot_id}")
         assert response.status_code == 200
 
         # Verify it's gone
-        list_response = client.get("/api/networth")
-        assert len(list_response.json) == 0
+        assert get_session().get(NetWorthSnapshot, snapshot_id) is None
 
     def test_delete_snapshot_not_found(self, client):
         """DELETE /api/networth/<id> returns 404 for non-existent."""
         response = client.delete("/api/networth/999")
         assert response.status_code == 404
 
-    def test_delete_snapshot_cascades_entries(self, client, seeded_categories):
+    def test_delete_snapshot_cascades_entries(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """DELETE /api/networth/<id> also deletes associated entries."""
-        cash_id = seeded_categories["Checking"]["id"]
-        create_response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 1000}],
-            },
-        )
-        snapshot_id = create_response.json["id"]
+        cash_id = seeded_categories["Checking"]
+        snapshot_id = snapshot_factory(entries=[(cash_id, 1000)])
 
-        # Delete snapshot
-        client.delete(f"/api/networth/{snapshot_id}")
-
-        # Category should still be deletable (entries were cascaded)
-        response = client.delete(f"/api/networth/categories/{cash_id}")
+        response = client.delete(f"/api/networth/{snapshot_id}")
         assert response.status_code == 200
 
+        entries = get_session().query(NetWorthEntry).filter_by(snapshot_id=snapshot_id)
+        assert entries.count() == 0
+
 
 # =============================================================================
 # Calculation Tests
 # =============================================================================
 
 
+def _calculated_snapshot(*entries):
+    """Build an unsaved snapshot and calculate its totals.
+
+    entries are (group_type, is_personal, amount) tuples, each given its own
+    category so calculate_totals can be checked without a request.
+    """
+    snapshot = NetWorthSnapshot(
+        month=1,
+        year=2024,
+        entries=[
+            NetWorthEntry(
+                category=NetWorthCategory(
+                    name=f"Category {i}",
+                    is_personal=is_personal,
+                    group=NetWorthGroup(name=f"Group {i}", group_type=group_type),
+                ),
+                amount=Decimal(amount),
+            )
+            for i, (group_type, is_personal, amount) in enumerate(entries)
+        ],
+    )
+    snapshot.calculate_totals()
+    return snapshot
+
+
 class TestNetWorthCalculations:
     """Tests for net worth derived field calculations."""
 
-    def test_total_assets_calculation(self, client, seeded_categories):
-        """Net worth correctly calculates total assets."""
-        cats = seeded_categories
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 1000},
-                    {"category_id": cats["Savings"]["id"], "amount": 2000},
-                    {
-                        "category_id": cats["Personal Investments"]["id"],
-                        "amount": 10000,
-                    },
-                ],
-            },
+    def test_total_assets_calculation(self):
+        """calculate_totals sums asset entries into total_assets."""
+        snapshot = _calculated_snapshot(
+            ("asset", True, 1000), ("asset", True, 2000), ("asset", True, 10000)
         )
-        assert response.status_code == 201
-        assert response.json["total_assets"] == 13000.0
+        assert snapshot.total_assets == 13000
 
-    def test_total_liabilities_calculation(self, client, seeded_categories):
-        """Net worth correctly calculates total liabilities."""
-        cats = seeded_categories
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [
-                    {"category_id": cats["Student Loan"]["id"], "amount": -10000},
-                    {"category_id": cats["Credit Card"]["id"], "amount": -500},
-                ],
-            },
-        )
-        assert response.status_code == 201
-        assert response.json["total_liabilities"] == -10500.0
-
-    def test_net_worth_calculation(self, client, seeded_categories):
-        """Net worth is total_assets + total_liabilities."""
-        cats = seeded_categories
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 5000},
-                    {"category_id": cats["Savings"]["id"], "amount": 10000},
-                    {"category_id": cats["Student Loan"]["id"], "amount": -3000},
-                ],
-            },
+    def test_total_liabilities_calculation(self):
+        """calculate_totals sums liability entries into total_liabilities."""
+        snapshot = _calculated_snapshot(
+            ("liability", True, -10000), ("liability", True, -500)
         )
-        assert response.status_code == 201
-        data = response.json
+        assert snapshot.total_liabilities == -10500
 
-        assert data["total_assets"] == 15000.0
-        assert data["total_liabilities"] == -3000.0
-        assert data["net_worth"] == 12000.0
-
-    def test_personal_wealth_calculation(self, client, seeded_categories):
+    def test_personal_wealth_calculation(self):
         """Personal wealth includes personal assets + liabilities."""
-        cats = seeded_categories
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 1000},  # personal
-                    {
-                        "category_id": cats["Personal Investments"]["id"],
-                        "amount": 5000,
-                    },  # personal
-                    {
-                        "category_id": cats["Company Investments"]["id"],
-                        "amount": 10000,
-                    },  # NOT personal
-                    {
-                        "category_id": cats["Student Loan"]["id"],
-                        "amount": -2000,
-                    },  # personal liability
-                ],
-            },
+        snapshot = _calculated_snapshot(
+            ("asset", True, 1000),
+            ("asset", True, 5000),
+            ("asset", False, 10000),  # NOT personal
+            ("liability", True, -2000),  # personal liability
         )
-        assert response.status_code == 201
-        data = response.json
-
         # Personal = 1000 + 5000 - 2000 = 4000
-        assert data["personal_wealth"] == 4000.0
+        assert snapshot.personal_wealth == 4000
 
-    def test_company_wealth_calculation(self, client, seeded_categories):
+    def test_company_wealth_calculation(self):
         """Company wealth includes only company assets."""
-        cats = seeded_categories
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 5000},  # personal
-                    {"category_id": cats["Company Investments"]["id"], "amount": 10000},
-                    {"category_id": cats["Company Checkings"]["id"], "amount": 3000},
-                ],
-            },
+        snapshot = _calculated_snapshot(
+            ("asset", True, 5000),  # personal
+            ("asset", False, 10000),
+            ("asset", False, 3000),
         )
-        assert response.status_code == 201
-        assert response.json["company_wealth"] == 13000.0
-
-    def test_group_totals_and_percentages(self, client, seeded_categories):
-        """Snapshot includes group totals and percentages."""
-        cats = seeded_categories
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 5000},
-                    {"category_id": cats["Personal Investments"]["id"], "amount": 5000},
-                ],
-            },
-        )
-        assert response.status_code == 201
-        data = response.json
-
-        # Total assets = 10000, by group name
-        assert data["by_group"]["Cash"] == 5000.0
-        assert data["by_group"]["Investments"] == 5000.0
-        assert data["percentages"]["Cash_pct"] == 50.0
-        assert data["percentages"]["Investments_pct"] == 50.0
+        assert snapshot.company_wealth == 13000
 
     def test_percentages_zero_assets(self, client):
         """Percentage calculations handle zero assets."""
-        response = client.post("/api/networth", json={"month": 1, "year": 2024})
+        response = client.post(
+            "/api/networth", data=EMPTY_SNAPSHOT_JSON, content_type="application/json"
+        )
         assert response.status_code == 201
         data = response.json
 
@@ -893,7 +843,7 @@ class TestNetWorthCalculations:
 
     def test_change_from_previous_first_month(self, client, seeded_categories):
         """First snapshot has 0 change_from_previous."""
-        cash_id = seeded_categories["Checking"]["id"]
+        cash_id = seeded_categories["Checking"]
         response = client.post(
             "/api/networth",
             json={
@@ -905,19 +855,14 @@ class TestNetWorthCalculations:
         assert response.status_code == 201
         assert response.json["change_from_previous"] == 0
 
-    def test_change_from_previous_subsequent_months(self, client, seeded_categories):
+    def test_change_from_previous_subsequent_months(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """Subsequent snapshots show change from previous month."""
-        cash_id = seeded_categories["Checking"]["id"]
+        cash_id = seeded_categories["Checking"]
 
         # January: 10000 net worth
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 10000}],
-            },
-        )
+        snapshot_factory(1, 2024, [(cash_id, 10000)])
 
         # February: 12500 net worth
         response = client.post(
@@ -931,19 +876,14 @@ class TestNetWorthCalculations:
         assert response.status_code == 201
         assert response.json["change_from_previous"] == 2500.0
 
-    def test_change_from_previous_year_boundary(self, client, seeded_categories):
+    def test_change_from_previous_year_boundary(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """Change calculation works across year boundary."""
-        cash_id = seeded_categories["Checking"]["id"]
+        cash_id = seeded_categories["Checking"]
 
         # December 2023: 50000
-        client.post(
-            "/api/networth",
-            json={
-                "month": 12,
-                "year": 2023,
-                "entries": [{"category_id": cash_id, "amount": 50000}],
-            },
-        )
+        snapshot_factory(12, 2023, [(cash_id, 50000)])
 
         # January 2024: 52000
         response = client.post(
@@ -958,13 +898,53 @@ class TestNetWorthCalculations:
         assert response.json["change_from_previous"] == 2000.0
 
 
+@pytest.fixture(scope="class")
+def created_snapshot(class_client, seeded_categories):
+    """Create one snapshot through the API once per class and return it."""
+    cats = seeded_categories
+    response = class_client.post(
+        "/api/networth",
+        json={
+            "month": 6,
+            "year": 2020,
+            "entries": [
+                {"category_id": cats["Checking"], "amount": 5000},
+                {"category_id": cats["Personal Investments"], "amount": 5000},
+                {"category_id": cats["Student Loan"], "amount": -3000},
+            ],
+        },
+    )
+    assert response.status_code == 201
+    return response.json
+
+
+class TestCreatedSnapshotTotals:
+    """Tests for the totals returned when a snapshot is created."""
+
+    @pytest.mark.parametrize(
+        "field,expected",
+        [
+            ("total_assets", 10000.0),
+            ("total_liabilities", -3000.0),
+            ("net_worth", 7000.0),
+            ("personal_wealth", 7000.0),
+            ("company_wealth", 0.0),
+            ("by_group", {"Cash": 5000.0, "Investments": 5000.0}),
+            ("percentages", {"Cash_pct": 50.0, "Investments_pct": 50.0}),
+        ],
+    )
+    def test_created_snapshot_totals(self, created_snapshot, field, expected):
+        """POST /api/networth returns the calculated totals and group breakdown."""
+        assert created_snapshot[field] == expected
+
+
 # =============================================================================
 # Seed Tests
 # =============================================================================
 
 
-class TestNetWorthSeed:
-    """Tests for net worth seed endpoint."""
+class TestNetWorthSeedWithoutCategories:
+    """Tests for the net worth seed endpoint before categories exist."""
 
     def test_seed_requires_categories(self, client):
         """POST /api/networth/seed fails without categories."""
@@ -972,47 +952,49 @@ class TestNetWorthSeed:
         assert response.status_code == 400
         assert "categories" in response.json["error"].lower()
 
+
+class TestNetWorthSeed:
+    """Tests for net worth seed endpoint."""
+
     def test_seed_creates_data(self, client, seeded_categories):
         """POST /api/networth/seed creates example data."""
         response = client.post("/api/networth/seed")
         assert response.status_code == 201
         assert response.json["count"] == 12
 
-    def test_seed_creates_12_months(self, client, seeded_categories):
-        """POST /api/networth/seed creates exactly 12 months."""
-        client.post("/api/networth/seed")
 
-        response = client.get("/api/networth")
-        assert len(response.json) == 12
+@pytest.fixture(scope="class")
+def seeded_snapshots(class_client, seeded_categories):
+    """Seed example snapshots once per class and return them, newest first."""
+    class_client.post("/api/networth/seed")
+    return class_client.get("/api/networth").json
 
-    def test_seed_data_has_growth(self, client, seeded_categories):
-        """Seeded data shows growth over time."""
-        client.post("/api/networth/seed")
 
-        response = client.get("/api/networth")
-        data = response.json
+class TestNetWorthSeedData:
+    """Tests for the snapshots created by the net worth seed endpoint."""
+
+    def test_seed_creates_12_months(self, seeded_snapshots):
+        """POST /api/networth/seed creates exactly 12 months."""
+        assert len(seeded_snapshots) == 12
 
+    def test_seed_data_has_growth(self, seeded_snapshots):
+        """Seeded data shows growth over time."""
         # Data is sorted desc, so first is most recent
-        first_month = data[-1]  # January (oldest)
-        last_month = data[0]  # December (newest)
+        first_month = seeded_snapshots[-1]  # January (oldest)
+        last_month = seeded_snapshots[0]  # December (newest)
 
         assert last_month["net_worth"] > first_month["net_worth"]
 
-    def test_seed_rejects_if_data_exists(self, client, seeded_categories):
+    def test_seed_rejects_if_data_exists(self, client, seeded_snapshots):
         """POST /api/networth/seed fails if data already exists."""
-        client.post("/api/networth/seed")
-
         response = client.post("/api/networth/seed")
         assert response.status_code == 409
 
-    def test_seed_calculates_derived_fields(self, client, seeded_categories):
+    def test_seed_calculates_derived_fields(self, seeded_snapshots):
         """Seeded data has all derived fields calculated."""
-        client.post("/api/networth/seed")
-
-        # Get a mid-year snapshot
-        response = client.get("/api/networth")
-        data = response.json
-        june = next(s for s in data if s["month"] == 6)
+        # Get a mid-year snapshot; all seeded months are in the same year
+        by_month = {s["month"]: s for s in seeded_snapshots}
+        june = by_month[6]
 
         # Check that calculated fields are populated
         assert june["total_assets"] > 0
@@ -1026,35 +1008,45 @@ class TestNetWorthSeed:
 # =============================================================================
 
 
+# (entries as (category name, amount), expected totals) for POST /api/networth
+NET_WORTH_EDGE_CASES = [
+    pytest.param(
+        [("Checking", 5000), ("Student Loan", -5000)],
+        {"net_worth": 0},
+        id="zero_net_worth",
+    ),
+    pytest.param(
+        [("Checking", 2000), ("Student Loan", -10000)],
+        {"net_worth": -8000.0},
+        id="negative_net_worth",
+    ),
+    pytest.param(
+        [("Student Loan", -15000), ("Credit Card", -2000)],
+        {"total_assets": 0, "total_liabilities": -17000.0, "net_worth": -17000.0},
+        id="only_liabilities",
+    ),
+]
+
+# (posted amount, returned amount) for a single entry
+AMOUNT_CONVERSION_CASES = [
+    pytest.param(1234.56, 1234.56, id="decimal_precision"),
+    pytest.param("5000.50", 5000.50, id="string_amount"),
+    pytest.param(999_999_999.99, 999_999_999.99, id="very_large_amount"),
+]
+
+
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    def test_list_sorted_across_years(self, client, seeded_categories):
+    def test_list_sorted_across_years(self, client, seeded_categories, bulk_snapshots):
         """GET /api/networth sorts correctly across year boundaries."""
-        cash_id = seeded_categories["Checking"]["id"]
-        client.post(
-            "/api/networth",
-            json={
-                "month": 12,
-                "year": 2023,
-                "entries": [{"category_id": cash_id, "amount": 1000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 1000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 11,
-                "year": 2023,
-                "entries": [{"category_id": cash_id, "amount": 1000}],
-            },
+        cash_id = seeded_categories["Checking"]
+        bulk_snapshots(
+            [
+                (12, 2023, cash_id, 1000),
+                (1, 2024, cash_id, 1000),
+                (11, 2023, cash_id, 1000),
+            ]
         )
 
         response = client.get("/api/networth")
@@ -1066,19 +1058,14 @@ class TestEdgeCases:
         assert data[1]["year"] == 2023 and data[1]["month"] == 12
         assert data[2]["year"] == 2023 and data[2]["month"] == 11
 
-    def test_change_from_previous_gap_in_months(self, client, seeded_categories):
+    def test_change_from_previous_gap_in_months(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """change_from_previous is 0 when previous month is missing."""
-        cash_id = seeded_categories["Checking"]["id"]
+        cash_id = seeded_categories["Checking"]
 
         # Only create January and March (skip February)
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 10000}],
-            },
-        )
+        snapshot_factory(1, 2024, [(cash_id, 10000)])
 
         response = client.post(
             "/api/networth",
@@ -1091,112 +1078,46 @@ class TestEdgeCases:
         # March should not find February
         assert response.json["change_from_previous"] == 0
 
-    def test_zero_net_worth(self, client, seeded_categories):
-        """Handles zero net worth correctly (assets = liabilities)."""
-        cats = seeded_categories
+    @pytest.mark.parametrize("entries,expected", NET_WORTH_EDGE_CASES)
+    def test_net_worth_edge_cases(self, client, seeded_categories, entries, expected):
+        """Totals handle zero, negative and liability-only net worth."""
         response = client.post(
             "/api/networth",
             json={
                 "month": 1,
                 "year": 2024,
                 "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 5000},
-                    {"category_id": cats["Student Loan"]["id"], "amount": -5000},
+                    {"category_id": seeded_categories[name], "amount": amount}
+                    for name, amount in entries
                 ],
             },
         )
         assert response.status_code == 201
-        assert response.json["net_worth"] == 0
-
-    def test_negative_net_worth(self, client, seeded_categories):
-        """Handles negative net worth (liabilities > assets)."""
-        cats = seeded_categories
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [
-                    {"category_id": cats["Checking"]["id"], "amount": 2000},
-                    {"category_id": cats["Student Loan"]["id"], "amount": -10000},
-                ],
-            },
-        )
-        assert response.status_code == 201
-        assert response.json["net_worth"] == -8000.0
+        data = response.json
+        assert {field: data[field] for field in expected} == expected
 
-    def test_only_liabilities(self, client, seeded_categories):
-        """Handles snapshot with only liabilities."""
-        cats = seeded_categories
+    @pytest.mark.parametrize("amount,expected", AMOUNT_CONVERSION_CASES)
+    def test_amount_conversion(self, client, seeded_categories, amount, expected):
+        """Entry amounts are stored and returned without losing precision."""
         response = client.post(
             "/api/networth",
             json={
                 "month": 1,
                 "year": 2024,
                 "entries": [
-                    {"category_id": cats["Student Loan"]["id"], "amount": -15000},
-                    {"category_id": cats["Credit Card"]["id"], "amount": -2000},
+                    {"category_id": seeded_categories["Checking"], "amount": amount}
                 ],
             },
         )
         assert response.status_code == 201
-        assert response.json["total_assets"] == 0
-        assert response.json["total_liabilities"] == -17000.0
-        assert response.json["net_worth"] == -17000.0
+        assert response.json["entries"][0]["amount"] == expected
 
-    def test_decimal_precision(self, client, seeded_categories):
-        """Amounts preserve decimal precision."""
-        cash_id = seeded_categories["Checking"]["id"]
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 1234.56}],
-            },
-        )
-        assert response.status_code == 201
-        assert response.json["entries"][0]["amount"] == 1234.56
-
-    def test_string_amount_conversion(self, client, seeded_categories):
-        """String amounts are converted correctly."""
-        cash_id = seeded_categories["Checking"]["id"]
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": "5000.50"}],
-            },
-        )
-        assert response.status_code == 201
-        assert response.json["entries"][0]["amount"] == 5000.50
-
-    def test_very_large_amounts(self, client, seeded_categories):
-        """Handles very large (but valid) amounts."""
-        cash_id = seeded_categories["Checking"]["id"]
-        response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 999_999_999.99}],
-            },
-        )
-        assert response.status_code == 201
-        assert response.json["entries"][0]["amount"] == 999_999_999.99
-
-    def test_change_from_previous_negative(self, client, seeded_categories):
+    def test_change_from_previous_negative(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """change_from_previous can be negative (wealth decreased)."""
-        cash_id = seeded_categories["Checking"]["id"]
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 20000}],
-            },
-        )
+        cash_id = seeded_categories["Checking"]
+        snapshot_factory(1, 2024, [(cash_id, 20000)])
 
         response = client.post(
             "/api/networth",
@@ -1208,20 +1129,14 @@ class TestEdgeCases:
         )
         assert response.json["change_from_previous"] == -5000.0
 
-    def test_update_recalculates_next_month(self, client, seeded_categories):
+    def test_update_recalculates_next_month(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """Updating a snapshot recalculates next month's change_from_previous."""
-        cash_id = seeded_categories["Checking"]["id"]
+        cash_id = seeded_categories["Checking"]
 
         # Create January: 10000
-        jan_response = client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2024,
-                "entries": [{"category_id": cash_id, "amount": 10000}],
-            },
-        )
-        jan_id = jan_response.json["id"]
+        jan_id = snapshot_factory(1, 2024, [(cash_id, 10000)])
 
         # Create February: 15000 (change = +5000)
         feb_response = client.post(
@@ -1244,20 +1159,14 @@ class TestEdgeCases:
         feb_check = client.get("/api/networth/2024/2")
         assert feb_check.json["change_from_previous"] == 3000.0
 
-    def test_update_recalculates_across_year_boundary(self, client, seeded_categories):
+    def test_update_recalculates_across_year_boundary(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """Updating December recalculates January's change_from_previous."""
-        cash_id = seeded_categories["Checking"]["id"]
+        cash_id = seeded_categories["Checking"]
 
         # Create December 2023: 50000
-        dec_response = client.post(
-            "/api/networth",
-            json={
-                "month": 12,
-                "year": 2023,
-                "entries": [{"category_id": cash_id, "amount": 50000}],
-            },
-        )
-        dec_id = dec_response.json["id"]
+        dec_id = snapshot_factory(12, 2023, [(cash_id, 50000)])
 
         # Create January 2024: 55000 (change = +5000)
         jan_response = client.post(
@@ -1332,17 +1241,12 @@ class TestForecast:
         assert data["data_points_used"] == 0
         assert data["projections"] == []
 
-    def test_forecast_single_snapshot(self, client, seeded_categories):
+    def test_forecast_single_snapshot(
+        self, client, seeded_categories, snapshot_factory
+    ):
         """GET /api/networth/forecast with one snapshot returns zero rate."""
         cats = seeded_categories
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 50000}],
-            },
-        )
+        snapshot_factory(1, 2025, [(cats["Checking"], 50000)])
 
         response = client.get("/api/networth/forecast")
         assert response.status_code == 200
@@ -1353,26 +1257,16 @@ class TestForecast:
         # But projections should still be generated (at flat rate)
         assert len(data["projections"]) == 12
 
-    def test_forecast_two_snapshots(self, client, seeded_categories):
+    def test_forecast_two_snapshots(self, client, seeded_categories, bulk_snapshots):
         """GET /api/networth/forecast calculates rate from two snapshots."""
-        cats = seeded_categories
+        checking_id = seeded_categories["Checking"]
 
         # Create two snapshots with 2000 increase
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 50000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 2,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 52000}],
-            },
+        bulk_snapshots(
+            [
+                (1, 2025, checking_id, 50000),
+                (2, 2025, checking_id, 52000),
+            ]
         )
 
         response = client.get("/api/networth/forecast")
@@ -1388,45 +1282,21 @@ class TestForecast:
         # 52000 + 2000 = 54000
         assert data["projections"][0]["projected_net_worth"] == 54000
 
-    def test_forecast_quarter_average(self, client, seeded_categories):
+    def test_forecast_quarter_average(self, client, seeded_categories, bulk_snapshots):
         """GET /api/networth/forecast averages over quarter by default."""
-        cats = seeded_categories
+        checking_id = seeded_categories["Checking"]
 
         # Create 4 snapshots with varying changes
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 50000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 2,
-                "year": 2025,
+        bulk_snapshots(
+            [
+                (1, 2025, checking_id, 50000),
                 # +1000
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 51000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 3,
-                "year": 2025,
+                (2, 2025, checking_id, 51000),
                 # +2000
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 53000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 4,
-                "year": 2025,
+                (3, 2025, checking_id, 53000),
                 # +3000
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 56000}],
-            },
+                (4, 2025, checking_id, 56000),
+            ]
         )
 
         response = client.get("/api/networth/forecast")
@@ -1435,35 +1305,18 @@ class TestForecast:
         assert data["monthly_change_rate"] == 2000
         assert data["data_points_used"] == 3
 
-    def test_forecast_period_month(self, client, seeded_categories):
+    def test_forecast_period_month(self, client, seeded_categories, bulk_snapshots):
         """GET /api/networth/forecast?period=month uses only last month change."""
-        cats = seeded_categories
+        checking_id = seeded_categories["Checking"]
 
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 50000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 2,
-                "year": 2025,
+        bulk_snapshots(
+            [
+                (1, 2025, checking_id, 50000),
                 # +1000
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 51000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 3,
-                "year": 2025,
+                (2, 2025, checking_id, 51000),
                 # +3000
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 54000}],
-            },
+                (3, 2025, checking_id, 54000),
+            ]
         )
 
         response = client.get("/api/networth/forecast?period=month")
@@ -1473,96 +1326,42 @@ class TestForecast:
         assert data["monthly_change_rate"] == 3000
         assert data["data_points_used"] == 1
 
-    def test_forecast_period_year(self, client, seeded_categories):
-        """GET /api/networth/forecast?period=year uses 12 months of data."""
-        cats = seeded_categories
-
-        # Create 13 months of snapshots
-        for i in range(13):
-            month = (i % 12) + 1
-            year = 2024 if i < 12 else 2025
-            amount = 50000 + (i * 1000)
-            client.post(
-                "/api/networth",
-                json={
-                    "month": month,
-                    "year": year,
-                    "entries": [
-                        {"category_id": cats["Checking"]["id"], "amount": amount}
-                    ],
-                },
-            )
-
-        response = client.get("/api/networth/forecast?period=year")
-        data = response.json
-        assert data["period"] == "year"
-        # Average of all 12 months of changes = 1000 each
-        assert data["monthly_change_rate"] == 1000
-        assert data["data_points_used"] == 12
-
-    def test_forecast_months_ahead(self, client, seeded_categories):
-        """GET /api/networth/forecast?months_ahead=6 returns 6 projections."""
-        cats = seeded_categories
-
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 50000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 2,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 52000}],
-            },
-        )
-
-        response = client.get("/api/networth/forecast?months_ahead=6")
-        data = response.json
-        assert data["months_ahead"] == 6
-        assert len(data["projections"]) == 6
-
     def test_forecast_invalid_period(self, client):
         """GET /api/networth/forecast rejects invalid period."""
         response = client.get("/api/networth/forecast?period=weekly")
         assert response.status_code == 400
         assert "period" in response.json["error"]
 
-    def test_forecast_invalid_months_ahead(self, client):
-        """GET /api/networth/forecast rejects invalid months_ahead."""
-        response = client.get("/api/networth/forecast?months_ahead=0")
-        assert response.status_code == 400
-
-        response = client.get("/api/networth/forecast?months_ahead=37")
-        assert response.status_code == 400
-
-        response = client.get("/api/networth/forecast?months_ahead=not_a_number")
-        assert response.status_code == 400
-
-    def test_forecast_year_rollover(self, client, seeded_categories):
+    @pytest.mark.parametrize(
+        "args,error",
+        [
+            pytest.param({}, None, id="defaults"),
+            pytest.param({"period": "weekly"}, "period", id="invalid_period"),
+            pytest.param({"months_ahead": "0"}, "months_ahead", id="months_ahead_0"),
+            pytest.param({"months_ahead": "37"}, "months_ahead", id="months_ahead_37"),
+            pytest.param(
+                {"months_ahead": "not_a_number"}, "months_ahead", id="months_ahead_text"
+            ),
+        ],
+    )
+    def test_forecast_params_validation(self, args, error):
+        """Forecast query parameters are validated without a request."""
+        if error is None:
+            assert _parse_forecast_params(args) == ("quarter", 12)
+        else:
+            with pytest.raises(ValueError, match=error):
+                _parse_forecast_params(args)
+
+    def test_forecast_year_rollover(self, client, seeded_categories, bulk_snapshots):
         """GET /api/networth/forecast handles year rollover correctly."""
-        cats = seeded_categories
+        checking_id = seeded_categories["Checking"]
 
         # Create snapshot in November 2025
-        client.post(
-            "/api/networth",
-            json={
-                "month": 11,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 50000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 12,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 51000}],
-            },
+        bulk_snapshots(
+            [
+                (11, 2025, checking_id, 50000),
+                (12, 2025, checking_id, 51000),
+            ]
         )
 
         response = client.get("/api/networth/forecast?months_ahead=3")
@@ -1574,26 +1373,16 @@ class TestForecast:
         assert data["projections"][1]["month"] == 2
         assert data["projections"][1]["year"] == 2026
 
-    def test_forecast_negative_change(self, client, seeded_categories):
+    def test_forecast_negative_change(self, client, seeded_categories, bulk_snapshots):
         """GET /api/networth/forecast handles negative trends correctly."""
-        cats = seeded_categories
+        checking_id = seeded_categories["Checking"]
 
-        client.post(
-            "/api/networth",
-            json={
-                "month": 1,
-                "year": 2025,
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 50000}],
-            },
-        )
-        client.post(
-            "/api/networth",
-            json={
-                "month": 2,
-                "year": 2025,
+        bulk_snapshots(
+            [
+                (1, 2025, checking_id, 50000),
                 # -2000
-                "entries": [{"category_id": cats["Checking"]["id"], "amount": 48000}],
-            },
+                (2, 2025, checking_id, 48000),
+            ]
         )
 
         response = client.get("/api/networth/forecast")
@@ -1601,3 +1390,53 @@ class TestForecast:
         assert data["monthly_change_rate"] == -2000
         # First projection: 48000 - 2000 = 46000
         assert data["projections"][0]["projected_net_worth"] == 46000
+
+
+@pytest.fixture(scope="class")
+def forecast_series(class_bulk_snapshots, seeded_categories):
+    """Insert January 2024 to January 2025, growing by 1000 a month, once per class."""
+    checking = seeded_categories["Checking"]
+    class_bulk_snapshots(
+        [
+            (1, 2024, checking, 50000),
+            (2, 2024, checking, 51000),
+            (3, 2024, checking, 52000),
+            (4, 2024, checking, 53000),
+            (5, 2024, checking, 54000),
+            (6, 2024, checking, 55000),
+            (7, 2024, checking, 56000),
+            (8, 2024, checking, 57000),
+            (9, 2024, checking, 58000),
+            (10, 2024, checking, 59000),
+            (11, 2024, checking, 60000),
+            (12, 2024, checking, 61000),
+            (1, 2025, checking, 62000),
+        ]
+    )
+
+
+class TestForecastSeries:
+    """Tests for forecasts over a steadily growing series of snapshots."""
+
+    @pytest.mark.parametrize(
+        "period,data_points",
+        [("month", 1), ("quarter", 3), ("half_year", 6), ("year", 12)],
+    )
+    def test_forecast_period(self, client, forecast_series, period, data_points):
+        """GET /api/networth/forecast?period=... uses that many monthly changes."""
+        response = client.get(f"/api/networth/forecast?period={period}")
+        data = response.json
+        assert data["period"] == period
+        assert data["monthly_change_rate"] == 1000
+        assert data["data_points_used"] == data_points
+
+    def test_forecast_months_ahead(self, client, forecast_series):
+        """GET /api/networth/forecast?months_ahead=6 returns 6 projections."""
+        response = client.get("/api/networth/forecast?months_ahead=6")
+        data = response.json
+        assert data["months_ahead"] == 6
+        assert len(data["projections"]) == 6
+        # Projections continue from January 2025 (62000)
+        assert data["projections"][0]["month"] == 2
+        assert data["projections"][0]["year"] == 2025
+        assert data["projections"][0]["projected_net_worth"] == 63000